@@ -13,6 +13,8 @@ Features:
 - Comprehensive error handling and race condition fixes
 - High-volume traffic generation (100-500 ops/min peak, 10-50 ops/min off-peak)
 - Lock file management to prevent multiple instances
+- Batched uploads: staged files are sent with one `obsctl cp --recursive` per batch
+- Payload pool: generated small and medium files are reused (hardlinked) across uploads of the same type and size range
 - FIXED: Race condition protection with file locking and operation tracking
 - FIXED: Graceful shutdown with proper thread synchronization
 - FIXED: Operation-aware TTL cleanup to prevent file deletion during uploads
@@ -27,11 +29,18 @@ import subprocess
 import logging
 import signal
 import shutil
-import fcntl
+import tempfile
 import json
+import queue
+from bisect import bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Event, RLock
+from itertools import accumulate
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from logging.handlers import QueueHandler, QueueListener
+from threading import Event
 from pathlib import Path
 
 # Import configuration from separate file
@@ -39,15 +48,34 @@ from traffic_config import (
     TEMP_DIR, OBSCTL_BINARY, MINIO_ENDPOINT, SCRIPT_DURATION_HOURS, MAX_CONCURRENT_USERS,
     PEAK_VOLUME_MIN, PEAK_VOLUME_MAX, OFF_PEAK_VOLUME_MIN, OFF_PEAK_VOLUME_MAX,
     REGULAR_FILE_TTL, LARGE_FILE_TTL, LARGE_FILE_THRESHOLD,
-    USER_CONFIGS, FILE_EXTENSIONS, OBSCTL_ENV,
-    DISK_SPACE_CONFIG, HIGH_VOLUME_CONFIG, SUBFOLDER_TEMPLATES,
-    get_disk_free_space_gb, should_stop_generation, needs_emergency_cleanup
+    USER_CONFIGS, FILE_PREFERENCE_TABLES, FILE_EXTENSIONS, BASE_OBSCTL_ENV,
+    DISK_SPACE_CONFIG, HIGH_VOLUME_CONFIG,
+    COMPILED_SUBFOLDER_TEMPLATES, DEFAULT_SUBFOLDER_TEMPLATES, template_fields, render,
+    get_disk_free_space_gb, should_stop_generation, needs_emergency_cleanup, start_disk_monitor
 )
 
 # Use imported configuration from traffic_config.py
 
+# 🚀 NEW: Activity table resolution - half hours, so zones like IST (+5.5) get exact slots
+ACTIVITY_SLOTS_PER_HOUR = 2
+
+@dataclass(frozen=True, slots=True)
+class UserConfig:
+    """One user persona from USER_CONFIGS, with attribute access"""
+    description: str
+    bucket: str
+    timezone_offset: float  # Hours from UTC - some personas use half-hour zones (IST is 5.5)
+    peak_hours: tuple
+    activity_multiplier: float
+    file_preferences: Mapping
+
+    def __post_init__(self):
+        # The activity table has half-hour slots - other offsets would be looked up rounded down
+        if not float(self.timezone_offset * ACTIVITY_SLOTS_PER_HOUR).is_integer():
+            raise ValueError(f"timezone_offset {self.timezone_offset} is not a whole or half hour")
+
 # Compatibility mappings for old variable names
-USERS = USER_CONFIGS
+USERS = {user_id: UserConfig(**user_config) for user_id, user_config in USER_CONFIGS.items()}
 TTL_CONFIG = {
     'regular_files_hours': REGULAR_FILE_TTL // 3600,
     'large_files_minutes': LARGE_FILE_TTL // 60,
@@ -93,6 +121,17 @@ for file_type, extensions in FILE_EXTENSIONS.items():
             'weight': 0.25
         }
 
+# 🚀 NEW: Freeze the size tables and precompute cumulative size weights once, with the
+# small file bias from HIGH_VOLUME_CONFIG applied, so selection never rebuilds them
+for file_config in FILE_TYPES.values():
+    size_weights = list(file_config['weights'])
+    if HIGH_VOLUME_CONFIG['small_file_bias'] > 0:
+        # Boost weight of smallest size range (80% small files for high object count)
+        size_weights[0] *= (1 + HIGH_VOLUME_CONFIG['small_file_bias'])
+    file_config['extensions'] = tuple(file_config['extensions'])
+    file_config['sizes'] = tuple(file_config['sizes'])
+    file_config['size_cum_weights'] = tuple(accumulate(size_weights))
+
 # Global variables for runtime state
 global_stats = {
     'operations': 0,
@@ -107,101 +146,223 @@ global_stats = {
 
 user_stats = {}
 stats_lock = threading.Lock()
-running = True
+
+# 🚀 NEW: Users count into their own _local_stats; these are folded into
+# user_stats/global_stats by aggregate_stats every STATS_FLUSH_INTERVAL seconds
+USER_STAT_KEYS = (
+    'operations', 'uploads', 'downloads', 'errors', 'bytes_transferred',
+    'files_created', 'large_files', 'subfolders_used', 'disk_space_checks',
+    'ttl_policies_applied'
+)
+GLOBAL_STAT_SOURCES = {key: key for key in global_stats}
+GLOBAL_STAT_SOURCES['large_files_created'] = 'large_files'
+STATS_FLUSH_INTERVAL = 5
 
 # Global bucket tracking to avoid duplicate creation attempts
-created_buckets = set()
+# Each bucket gets an Event, set once it exists; the lock only guards the dict
+bucket_ready = {}  # bucket -> Event
 bucket_creation_lock = threading.Lock()
+BUCKET_CREATION_WAIT = 60  # Seconds a second caller waits for the first to create the bucket
+BUCKET_EXISTS_ERRORS = ('BucketAlreadyOwnedByYou', 'BucketAlreadyExists')
 
 # 🔥 CRITICAL FIX: Operation tracking to prevent race conditions
-active_operations = {}  # file_path -> operation_info
-operations_lock = RLock()  # Reentrant lock for nested operations
+# Partitioned per user: only the owning user thread writes to its partition, so the
+# common path needs no lock. Cross-user readers only take atomic snapshots.
+active_operations = {}  # user_id -> {file_path: operation_info}
 
-# 🔥 CRITICAL FIX: Shutdown coordination
+# 🔥 CRITICAL FIX: Shutdown coordination - shutdown_event is the single run/stop flag
 shutdown_event = Event()
-user_threads_completed = Event()
-all_users_stopped = threading.Barrier(len(USERS) + 1)  # +1 for main thread
+users_done = threading.Semaphore(0)  # Released once by each user thread as it exits
+USER_SHUTDOWN_TIMEOUT = 45  # Seconds to wait for all users to stop
+
+# Binary content: fully random up to BINARY_RANDOM_LIMIT, repeated random blocks beyond
+BINARY_RANDOM_LIMIT = 64 * 1024 * 1024
+BINARY_FILL_BLOCK = 1024 * 1024
+
+# Process pool for CPU-bound content generation (set up by ConcurrentTrafficGenerator)
+content_executor = None
+
+# 🚀 NEW: Threads only enqueue log records; listener threads format and write them.
+# User records are pre-formatted with their [user_id] prefix by their QueueHandler.
+log_queue = queue.SimpleQueue()
+user_log_queue = queue.SimpleQueue()
+
+# 🚀 NEW: Shared pool of generated payloads, hardlinked into upload batches
+# instead of generating fresh content per upload. Filled lazily per (file_type, size_idx),
+# except for the largest size range of each type, and capped at payload_pool_max_mb in total.
+PAYLOAD_POOL_DIR = os.path.join(TEMP_DIR, '_pool')
+payload_pool = {}  # (file_type, size_idx) -> [(pool_path, size_bytes)]
+payload_pool_bytes = 0  # Bytes in pooled and reserved pool slots, guarded by payload_pool_lock
+payload_pool_lock = threading.Lock()
+PAYLOAD_POOL_OWNER = '_pool'  # Operations partition that keeps pooled files out of cleanup
 
 # Lock file path
 LOCK_FILE = "/tmp/obsctl-traffic-generator.lock"
 
-def acquire_lock():
-    """Acquire exclusive lock to prevent multiple instances"""
+def read_lock_pid():
+    """Read the PID recorded in the lock file, or None if it can't be read"""
     try:
-        lock_fd = os.open(LOCK_FILE, os.O_CREAT | os.O_WRONLY | os.O_TRUNC)
-        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        with open(LOCK_FILE, 'r') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
 
-        # Write PID to lock file
-        os.write(lock_fd, f"{os.getpid()}\n".encode())
-        os.fsync(lock_fd)
-
-        return lock_fd
-    except (OSError, IOError) as e:
-        print(f"ERROR: Another traffic generator instance is already running")
-        print(f"Lock file: {LOCK_FILE}")
-        if os.path.exists(LOCK_FILE):
-            try:
-                with open(LOCK_FILE, 'r') as f:
-                    existing_pid = f.read().strip()
+def is_pid_alive(pid):
+    """Check if a process with the given PID exists"""
+    try:
+        os.kill(pid, 0)  # Signal 0 just checks if process exists
+        return True
+    except PermissionError:
+        return True  # Exists, but owned by another user
+    except OSError:
+        return False
+
+def acquire_lock():
+    """Acquire exclusive lock to prevent multiple instances
+
+    The lock file is created with O_EXCL, so creation either succeeds atomically
+    or fails because another instance holds it. A lock left behind by a dead
+    process is removed and creation is retried once.
+    """
+    for attempt in range(2):
+        try:
+            lock_fd = os.open(LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            existing_pid = read_lock_pid()
+            if attempt == 0 and existing_pid is not None and not is_pid_alive(existing_pid):
+                # Stale lock from a previous run - remove it and retry
+                try:
+                    os.unlink(LOCK_FILE)
+                except FileNotFoundError:
+                    pass
+                continue
+
+            print(f"ERROR: Another traffic generator instance is already running")
+            print(f"Lock file: {LOCK_FILE}")
+            if existing_pid is not None:
                 print(f"Existing PID: {existing_pid}")
-            except:
-                pass
-        sys.exit(1)
+            sys.exit(1)
+
+        # Write PID to lock file
+        try:
+            os.write(lock_fd, f"{os.getpid()}\n".encode())
+        finally:
+            os.close(lock_fd)
+        return
 
-def release_lock(lock_fd):
-    """Release the exclusive lock"""
+    print(f"ERROR: Could not acquire lock file: {LOCK_FILE}")
+    sys.exit(1)
+
+def release_lock():
+    """Release the exclusive lock if this process still owns it"""
     try:
-        fcntl.flock(lock_fd, fcntl.LOCK_UN)
-        os.close(lock_fd)
-        if os.path.exists(LOCK_FILE):
+        if read_lock_pid() == os.getpid():
             os.unlink(LOCK_FILE)
-    except:
+    except OSError:
         pass
 
 def check_if_running():
     """Check if traffic generator is already running"""
-    if os.path.exists(LOCK_FILE):
-        try:
-            with open(LOCK_FILE, 'r') as f:
-                pid = int(f.read().strip())
+    pid = read_lock_pid()
+    if pid is None:
+        return False, None
 
-            # Check if process is still running
-            try:
-                os.kill(pid, 0)  # Signal 0 just checks if process exists
-                return True, pid
-            except OSError:
-                # Process not running, remove stale lock file
-                os.unlink(LOCK_FILE)
-                return False, None
-        except:
-            return False, None
+    if is_pid_alive(pid):
+        return True, pid
+
+    # Process not running, remove stale lock file
+    try:
+        os.unlink(LOCK_FILE)
+    except OSError:
+        pass
     return False, None
 
 # 🔥 CRITICAL FIX: Operation tracking functions
+def get_user_operations(user_id):
+    """Get the active operations partition owned by a user"""
+    return active_operations.setdefault(user_id, {})
+
 def register_operation(file_path, operation_type, user_id):
     """Register an active operation to prevent race conditions"""
-    with operations_lock:
-        active_operations[file_path] = {
-            'type': operation_type,
-            'user_id': user_id,
-            'start_time': time.time(),
-            'thread_id': threading.current_thread().ident
-        }
+    get_user_operations(user_id)[file_path] = {
+        'type': operation_type,
+        'start_time': time.time(),
+        'thread_id': threading.current_thread().ident
+    }
 
-def unregister_operation(file_path):
+def unregister_operation(file_path, user_id):
     """Unregister a completed operation"""
-    with operations_lock:
-        active_operations.pop(file_path, None)
+    get_user_operations(user_id).pop(file_path, None)
+
+def is_file_in_use(file_path, user_id=None):
+    """Check if a file is currently being used in an operation
+
+    Pass user_id to only check that user's partition (the common case, since
+    each user works in its own temp directory).
+    """
+    if user_id is not None:
+        return file_path in get_user_operations(user_id)
+
+    return any(file_path in user_ops for user_ops in list(active_operations.values()))
 
-def is_file_in_use(file_path):
-    """Check if a file is currently being used in an operation"""
-    with operations_lock:
-        return file_path in active_operations
+def remove_unused_files(top, user_id=None):
+    """Remove files under top that aren't in active operations, plus directories left empty
+
+    os.scandir yields entries with their full path and file type from one
+    directory read, and removals are resolved relative to an open descriptor of
+    the directory instead of looking up the full path again. Returns
+    (files_removed, files_protected).
+    """
+    files_removed = 0
+    files_protected = 0
+    try:
+        dir_fd = os.open(top, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return files_removed, files_protected
+
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                removed, protected = remove_unused_files(entry.path, user_id)
+                files_removed += removed
+                files_protected += protected
+                try:
+                    os.rmdir(entry.name, dir_fd=dir_fd)
+                except OSError:
+                    pass  # Directory not empty
+            elif is_file_in_use(entry.path, user_id):
+                files_protected += 1
+            else:
+                try:
+                    os.unlink(entry.name, dir_fd=dir_fd)
+                    files_removed += 1
+                except OSError:
+                    pass
+    finally:
+        os.close(dir_fd)
+
+    return files_removed, files_protected
+
+def add_pooled_payload(pooled, slot, pool_path, size_bytes):
+    """Publish a generated payload in its pool slot - caller holds payload_pool_lock"""
+    pooled[slot] = (pool_path, size_bytes)
+    register_operation(pool_path, 'pool', PAYLOAD_POOL_OWNER)
+
+def release_payload_pool():
+    """Forget all pooled payloads and delete their files"""
+    global payload_pool_bytes
+    with payload_pool_lock:
+        payload_pool.clear()
+        payload_pool_bytes = 0
+        active_operations.pop(PAYLOAD_POOL_OWNER, None)
+    shutil.rmtree(PAYLOAD_POOL_DIR, ignore_errors=True)
 
 def get_active_operations_for_user(user_id):
     """Get all active operations for a specific user"""
-    with operations_lock:
-        return [path for path, info in active_operations.items() if info['user_id'] == user_id]
+    return list(get_user_operations(user_id))
 
 def wait_for_user_operations_complete(user_id, timeout=30):
     """Wait for all operations for a specific user to complete"""
@@ -213,41 +374,240 @@ def wait_for_user_operations_complete(user_id, timeout=30):
         time.sleep(0.1)
     return False
 
+# 🚀 NEW: Realistic values for SUBFOLDER_TEMPLATES placeholders.
+# Each generator takes the Random instance to draw from.
+def _pick(*choices):
+    return lambda rng: rng.choice(choices)
+
+SUBFOLDER_PLACEHOLDERS = {
+    'project': _pick('web-app', 'mobile-client', 'api-service', 'data-pipeline', 'ml-model'),
+    'campaign': _pick('q1-launch', 'summer-sale', 'brand-refresh', 'product-demo', 'holiday-2024'),
+    'dataset': _pick('customer-data', 'sales-metrics', 'user-behavior', 'market-research', 'inventory'),
+    'model': _pick('recommendation', 'classification', 'clustering', 'regression', 'nlp-sentiment'),
+    'system': _pick('web-servers', 'databases', 'load-balancers', 'cache-cluster', 'api-gateway'),
+    'client': _pick('acme-corp', 'beta-tech', 'gamma-solutions', 'delta-industries', 'epsilon-labs'),
+    'app': _pick('ios-main', 'android-main', 'react-native', 'flutter-app', 'hybrid-app'),
+    'service': _pick('user-auth', 'payment-processor', 'notification-service', 'analytics-api', 'file-storage'),
+    'env': _pick('dev', 'staging', 'prod', 'test', 'demo'),
+    'platform': _pick('facebook', 'instagram', 'twitter', 'linkedin', 'youtube'),
+    'category': _pick('photos', 'videos', 'documents', 'templates', 'assets'),
+    'subcategory': _pick('high-res', 'thumbnails', 'originals', 'processed', 'archived'),
+    'region': _pick('north-america', 'europe', 'asia-pacific', 'latin-america', 'middle-east'),
+    'quarter': _pick('q1-2024', 'q2-2024', 'q3-2024', 'q4-2024'),
+    'year': _pick('2023', '2024', '2025'),
+    'month': _pick('01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12'),
+    'day': lambda rng: f"{rng.randint(1, 28):02d}",
+    'week': lambda rng: f"{rng.randint(1, 52):02d}",
+    'date': lambda rng: datetime.now().strftime('%Y-%m-%d'),
+    'topic': _pick('machine-learning', 'data-analysis', 'user-research', 'market-trends', 'security'),
+    'study': _pick('user-behavior', 'performance-analysis', 'ab-testing', 'market-research', 'usability'),
+    'partner': _pick('university-x', 'research-institute', 'tech-company', 'startup-incubator', 'consulting-firm'),
+    'version': lambda rng: f"v{rng.randint(1, 10)}.{rng.randint(0, 9)}.{rng.randint(0, 9)}",
+    'experiment_id': lambda rng: f"exp-{rng.randint(1000, 9999)}"
+}
+
+def subfolder_fillers(compiled):
+    """Map each placeholder of a compiled template to its value generator
+
+    Placeholders without a SUBFOLDER_PLACEHOLDERS entry stay literal.
+    """
+    fillers = {}
+    for field_name in template_fields(compiled):
+        literal = f'{{{field_name}}}'
+        fillers[field_name] = SUBFOLDER_PLACEHOLDERS.get(field_name, lambda rng, literal=literal: literal)
+    return fillers
+
+# 🚀 NEW: Content generation helpers - module level so they can run in worker processes
+def _utf8_len(text):
+    """Encoded size of text in bytes"""
+    return len(text.encode())
+
+def build_code_content(size_bytes, user_id, description):
+    """Generate realistic code content"""
+    code_templates = [
+        "def function_{}():\n    '''Generated function for {user}'''\n    return {}\n\n",
+        "class Class{}:\n    def __init__(self):\n        self.{user}_value = {}\n\n",
+        "# {user} - {desc}\n# This is a comment about {}\nvar_{} = {}\n\n",
+        "import {}\nfrom {} import {}\n# {user} imports\n\n"
+    ]
+
+    header = f"# Generated code file for {user_id}\n# {description}\n\n"
+    # Templates are ASCII, so only non-ASCII user details need encoding to measure
+    text_len = len if header.isascii() else _utf8_len
+    parts = [header]
+    byte_count = text_len(header)
+    while byte_count < size_bytes:
+        template = random.choice(code_templates)
+        part = template.format(
+            random.randint(1, 1000),
+            random.randint(1, 1000),
+            random.randint(1, 1000),
+            user=user_id,
+            desc=description
+        )
+        parts.append(part)
+        byte_count += text_len(part)
+
+    return ''.join(parts)[:size_bytes]
+
+# Average encoded size of a document word plus its separator, for bulk word draws
+DOCUMENT_BYTES_PER_WORD = 8
+
+def build_document_content(size_bytes, user_id, description):
+    """Generate realistic document content"""
+    words = [
+        "data", "analysis", "report", "summary", "business", "metrics",
+        "performance", "optimization", "cloud", "storage", "transfer",
+        "monitoring", "dashboard", "analytics", "insights", "trends",
+        user_id, "project", "research", "development"
+    ]
+
+    header = f"Document by {user_id}\nDepartment: {description}\n\n"
+    # Words are ASCII, so only non-ASCII user details need encoding to measure
+    text_len = len if header.isascii() else _utf8_len
+    parts = [header]
+    byte_count = text_len(header)
+
+    while byte_count < size_bytes:
+        # Draw the words for (roughly) the rest of the document in one call
+        chosen = random.choices(words, k=max(16, (size_bytes - byte_count) // DOCUMENT_BYTES_PER_WORD))
+        pos = 0
+        while pos < len(chosen) and byte_count < size_bytes:
+            sentence_length = random.randint(5, 15)
+            sentence = " ".join(chosen[pos:pos + sentence_length]).capitalize() + ". "
+            pos += sentence_length
+
+            if random.random() < 0.1:
+                sentence += "\n\n"
+
+            parts.append(sentence)
+            byte_count += text_len(sentence)
+
+    return ''.join(parts)[:size_bytes]
+
+def _write_text_file(file_path, file_type, size_bytes, user_id, description):
+    """Generate text content and write it to file_path"""
+    if file_type == 'code':
+        content = build_code_content(size_bytes, user_id, description)
+    else:
+        content = build_document_content(size_bytes, user_id, description)
+
+    with open(file_path, 'w') as f:
+        f.write(content)
+
+def write_binary_file(file_path, size_bytes):
+    """Write binary content with a handful of large writes instead of 8KB chunks"""
+    with open(file_path, 'wb') as f:
+        if size_bytes <= BINARY_RANDOM_LIMIT:
+            f.write(os.urandom(size_bytes))
+            return
+
+        # S3 doesn't care about the bytes - repeat one random block for large files
+        block = os.urandom(BINARY_FILL_BLOCK)
+        full_blocks, remainder = divmod(size_bytes, BINARY_FILL_BLOCK)
+        for _ in range(full_blocks):
+            f.write(block)
+        if remainder:
+            f.write(memoryview(block)[:remainder])
+
+def _write_payload_file(file_path, file_type, size_bytes, user_id, description):
+    """Write a file of any type - the content worker entry point for pool prewarming"""
+    if file_type in ('code', 'documents'):
+        _write_text_file(file_path, file_type, size_bytes, user_id, description)
+    else:
+        write_binary_file(file_path, size_bytes)
+
+# 🚀 NEW: Every fd Python opens is non-inheritable (PEP 446), so obsctl children don't
+# need close_fds' scan of the fd table - and without it subprocess can use posix_spawn
+OBSCTL_CLOSE_FDS = False
+# Opened once and shared - subprocess.DEVNULL opens and closes /dev/null on every spawn
+OBSCTL_DEVNULL = os.open(os.devnull, os.O_WRONLY)
+
+def _init_content_worker():
+    """Content workers leave shutdown signals to the main process"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def write_text_file(file_path, file_type, size_bytes, user_id, description):
+    """Write a text file, in a content worker process when the pool is available"""
+    if content_executor is not None:
+        try:
+            content_executor.submit(_write_text_file, file_path, file_type, size_bytes, user_id, description).result()
+            return
+        except BrokenProcessPool:
+            pass  # Fall back to generating in this thread
+
+    _write_text_file(file_path, file_type, size_bytes, user_id, description)
+
+def pick_weighted_index(rng, cum_weights):
+    """Draw an index from precomputed cumulative weights - random.choices' bisect, minus its list"""
+    return bisect_right(cum_weights, rng.random() * cum_weights[-1], 0, len(cum_weights) - 1)
+
+def handle_shutdown_signal(signum, frame):
+    """SIGINT/SIGTERM handler - signal all threads to stop"""
+    logging.getLogger(__name__).info("Received shutdown signal, stopping all users...")
+    shutdown_event.set()
+
 class UserSimulator:
     """Individual user simulator that runs in its own thread"""
 
     def __init__(self, user_id, user_config):
         self.user_id = user_id
         self.user_config = user_config
-        self.bucket = user_config['bucket']
+        self.bucket = user_config.bucket
+        self._bucket_uri = f"s3://{self.bucket}/"
+        self._bucket_uri_noslash = f"s3://{self.bucket}"
+        self._env = BASE_OBSCTL_ENV  # 🚀 NEW: Built once at import, shared by every obsctl call
         self.user_temp_dir = os.path.join(TEMP_DIR, user_id)
         os.makedirs(self.user_temp_dir, exist_ok=True)
         self.logger = self.setup_user_logger()
         self.user_stopped = Event()  # 🔥 CRITICAL FIX: Individual user stop event
+        self._rng = random.Random()  # 🚀 NEW: Per-user random state, not shared across threads
+        get_user_operations(user_id)  # Create this user's operations partition up front
 
         # 🚀 NEW: Subfolder management
-        self.subfolder_templates = SUBFOLDER_TEMPLATES.get(self.bucket, ['files'])
+        self.compiled_templates = [
+            (compiled, subfolder_fillers(compiled))
+            for compiled in COMPILED_SUBFOLDER_TEMPLATES.get(self.bucket, DEFAULT_SUBFOLDER_TEMPLATES)
+        ]
         self.used_subfolders = set()
         self.files_per_subfolder = {}
 
+        # 🚀 NEW: Cumulative file type weights for select_file_type_and_size
+        self.file_types, self.file_type_cum_weights = FILE_PREFERENCE_TABLES[user_id]
+
+        # 🚀 NEW: Activity only depends on the hour, so it is looked up, not recomputed
+        self.activity_table = self.build_activity_table()
+
         # 🚀 NEW: High-volume file tracking
         self.total_files_created = 0
         self.last_disk_check = 0
 
+        # 🚀 NEW: Batched uploads - files are staged and sent with one obsctl cp
+        self.pending_uploads = []  # (local_path, subfolder_path, size_bytes)
+        self.batch_dir = None
+        self.batch_seq = 0
+        self.batch_started = 0
+        self.upload_seq = 0
+        self.download_seq = 0
+        self.inflight_ops = []  # (process, stderr_file, started, timeout, on_done)
+
+        # 🚀 NEW: Cached bucket listing so downloads don't spawn obsctl ls every time
+        self.listing_cache = []
+        self.listing_fetched = 0
+
+        # 🚀 NEW: Lock-free counters, only ever written by this user's thread
+        self._local_stats = dict.fromkeys(USER_STAT_KEYS, 0)
+
         # Initialize user stats if not already done
         with stats_lock:
             if user_id not in user_stats:
-                user_stats[user_id] = {
-                    'operations': 0, 'uploads': 0, 'downloads': 0, 'errors': 0,
-                    'bytes_transferred': 0, 'files_created': 0, 'large_files': 0,
-                    'subfolders_used': 0, 'disk_space_checks': 0
-                }
+                user_stats[user_id] = dict(self._local_stats)
 
     def setup_user_logger(self):
         """Setup logger for this specific user"""
         logger = logging.getLogger(f"user.{self.user_id}")
         if not logger.handlers:
-            handler = logging.StreamHandler()
+            handler = QueueHandler(user_log_queue)
             formatter = logging.Formatter(f'%(asctime)s - %(levelname)s - [{self.user_id}] %(message)s')
             handler.setFormatter(formatter)
             logger.addHandler(handler)
@@ -264,9 +624,11 @@ class UserSimulator:
 
         self.last_disk_check = current_time
         free_gb = get_disk_free_space_gb()
+        # A cached reading near the stop threshold may be stale - confirm it before stopping
+        if free_gb <= DISK_SPACE_CONFIG['stop_threshold_gb']:
+            free_gb = get_disk_free_space_gb(force=True)
 
-        with stats_lock:
-            user_stats[self.user_id]['disk_space_checks'] += 1
+        self._local_stats['disk_space_checks'] += 1
 
         if needs_emergency_cleanup():
             self.logger.critical(f"EMERGENCY: Only {free_gb:.1f}GB free! Stopping immediately.")
@@ -284,48 +646,15 @@ class UserSimulator:
         if not HIGH_VOLUME_CONFIG['use_subfolders']:
             return ""
 
-        # Select a template
-        template = random.choice(self.subfolder_templates)
-
-        # Fill in template variables with realistic values
-        replacements = {
-            'project': random.choice(['web-app', 'mobile-client', 'api-service', 'data-pipeline', 'ml-model']),
-            'campaign': random.choice(['q1-launch', 'summer-sale', 'brand-refresh', 'product-demo', 'holiday-2024']),
-            'dataset': random.choice(['customer-data', 'sales-metrics', 'user-behavior', 'market-research', 'inventory']),
-            'model': random.choice(['recommendation', 'classification', 'clustering', 'regression', 'nlp-sentiment']),
-            'system': random.choice(['web-servers', 'databases', 'load-balancers', 'cache-cluster', 'api-gateway']),
-            'client': random.choice(['acme-corp', 'beta-tech', 'gamma-solutions', 'delta-industries', 'epsilon-labs']),
-            'app': random.choice(['ios-main', 'android-main', 'react-native', 'flutter-app', 'hybrid-app']),
-            'service': random.choice(['user-auth', 'payment-processor', 'notification-service', 'analytics-api', 'file-storage']),
-            'env': random.choice(['dev', 'staging', 'prod', 'test', 'demo']),
-            'platform': random.choice(['facebook', 'instagram', 'twitter', 'linkedin', 'youtube']),
-            'category': random.choice(['photos', 'videos', 'documents', 'templates', 'assets']),
-            'subcategory': random.choice(['high-res', 'thumbnails', 'originals', 'processed', 'archived']),
-            'region': random.choice(['north-america', 'europe', 'asia-pacific', 'latin-america', 'middle-east']),
-            'quarter': random.choice(['q1-2024', 'q2-2024', 'q3-2024', 'q4-2024']),
-            'year': random.choice(['2023', '2024', '2025']),
-            'month': random.choice(['01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12']),
-            'day': f"{random.randint(1, 28):02d}",
-            'week': f"{random.randint(1, 52):02d}",
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'topic': random.choice(['machine-learning', 'data-analysis', 'user-research', 'market-trends', 'security']),
-            'study': random.choice(['user-behavior', 'performance-analysis', 'ab-testing', 'market-research', 'usability']),
-            'partner': random.choice(['university-x', 'research-institute', 'tech-company', 'startup-incubator', 'consulting-firm']),
-            'version': f"v{random.randint(1, 10)}.{random.randint(0, 9)}.{random.randint(0, 9)}",
-            'experiment_id': f"exp-{random.randint(1000, 9999)}"
-        }
-
-        # Replace placeholders in template
-        path = template
-        for key, value in replacements.items():
-            path = path.replace(f'{{{key}}}', value)
+        # Select a precompiled template and fill only the placeholders it uses
+        compiled, fillers = self._rng.choice(self.compiled_templates)
+        path = render(compiled, {field: fill(self._rng) for field, fill in fillers.items()})
 
         # Track subfolder usage
         if path not in self.used_subfolders:
             self.used_subfolders.add(path)
             self.files_per_subfolder[path] = 0
-            with stats_lock:
-                user_stats[self.user_id]['subfolders_used'] += 1
+            self._local_stats['subfolders_used'] += 1
 
         # Check if we should create a new subfolder (limit files per subfolder)
         if self.files_per_subfolder[path] >= HIGH_VOLUME_CONFIG['files_per_subfolder']:
@@ -337,62 +666,63 @@ class UserSimulator:
 
         return path
 
-    def get_current_activity_level(self):
-        """Calculate current activity level based on user's timezone and peak hours"""
-        current_hour = datetime.now().hour
-        user_hour = (current_hour + self.user_config['timezone_offset']) % 24
+    def build_activity_table(self):
+        """Precompute (activity_level, mode) for each half-hour slot of the user's day"""
+        peak_start, peak_end = self.user_config.peak_hours
+        base_activity = self.user_config.activity_multiplier
+        forced_peak = hash(self.user_id) % 10 < 8  # 80% of users get forced peak activity
+
+        table = []
+        for slot in range(24 * ACTIVITY_SLOTS_PER_HOUR):
+            user_hour = slot / ACTIVITY_SLOTS_PER_HOUR
+            # Handle peak hours that span midnight
+            if peak_start > peak_end:
+                is_peak = user_hour >= peak_start or user_hour <= peak_end
+            else:
+                is_peak = peak_start <= user_hour <= peak_end
 
-        peak_start, peak_end = self.user_config['peak_hours']
+            # Force high activity for high-volume testing
+            if forced_peak:
+                table.append((base_activity * 4.0, "HIGH-VOLUME MODE"))  # Quadruple activity for testing
+            elif is_peak:
+                table.append((base_activity * 2.5, "NATURAL PEAK"))  # High activity during peak hours
+            else:
+                table.append((base_activity * 0.5, "OFF PEAK"))  # Reduced activity during off hours
 
-        # Handle peak hours that span midnight
-        if peak_start > peak_end:
-            is_peak = user_hour >= peak_start or user_hour <= peak_end
-        else:
-            is_peak = peak_start <= user_hour <= peak_end
+        return tuple(table)
 
-        base_activity = self.user_config['activity_multiplier']
+    def get_current_activity_level(self):
+        """Calculate current activity level based on user's timezone and peak hours"""
+        user_hour = (time.localtime().tm_hour + self.user_config.timezone_offset) % 24
 
         # 🚀 ENHANCED: High-volume generation with disk space awareness
         if not self.check_disk_space():
             return 0  # Stop activity if disk space is low
 
-        # Force high activity for high-volume testing
-        if hash(self.user_id) % 10 < 8:  # 80% of users get forced peak activity
-            activity_level = base_activity * 4.0  # Quadruple activity for testing
-            self.logger.debug(f"HIGH-VOLUME MODE: user_hour={user_hour}, activity={activity_level:.1f}")
-        elif is_peak:
-            activity_level = base_activity * 2.5  # High activity during peak hours
-            self.logger.debug(f"NATURAL PEAK: user_hour={user_hour}, activity={activity_level:.1f}")
-        else:
-            activity_level = base_activity * 0.5  # Reduced activity during off hours
-            self.logger.debug(f"OFF PEAK: user_hour={user_hour}, activity={activity_level:.1f}")
+        # Offsets may be fractional (IST is +5.5) - index by half-hour slot, not by hour
+        activity_level, mode = self.activity_table[int(user_hour * ACTIVITY_SLOTS_PER_HOUR) % len(self.activity_table)]
 
-        return activity_level
+        # Called once per operation - %-style args are only formatted if debug is on
+        self.logger.debug("%s: user_hour=%s, activity=%.1f", mode, user_hour, activity_level)
 
-    def select_file_type_and_size(self):
-        """🚀 ENHANCED: Select file type and size using weighted distributions"""
-        file_preferences = self.user_config['file_preferences']
+        return activity_level
 
+    def select_file_type_and_size_range(self):
+        """Select file type and the index of its size range using weighted distributions"""
         # Use weighted random selection based on user preferences
-        file_types = list(file_preferences.keys())
-        weights = list(file_preferences.values())
-        file_type = random.choices(file_types, weights=weights)[0]
+        file_type = self.file_types[pick_weighted_index(self._rng, self.file_type_cum_weights)]
 
-        # Get file type configuration
+        # Select size range using precomputed weights (small file bias already applied)
         file_config = FILE_TYPES[file_type]
+        size_idx = pick_weighted_index(self._rng, file_config['size_cum_weights'])
 
-        # Select size range using weights (80% small files for high object count)
-        size_ranges = file_config['sizes']
-        size_weights = file_config.get('weights', [1.0] * len(size_ranges))
+        return file_type, size_idx
 
-        # Apply small file bias from HIGH_VOLUME_CONFIG
-        if HIGH_VOLUME_CONFIG['small_file_bias'] > 0:
-            # Boost weight of smallest size range
-            size_weights = list(size_weights)
-            size_weights[0] *= (1 + HIGH_VOLUME_CONFIG['small_file_bias'])
-
-        selected_range = random.choices(size_ranges, weights=size_weights)[0]
-        size_bytes = random.randint(selected_range[0], selected_range[1])
+    def select_file_type_and_size(self):
+        """🚀 ENHANCED: Select file type and size using weighted distributions"""
+        file_type, size_idx = self.select_file_type_and_size_range()
+        selected_range = FILE_TYPES[file_type]['sizes'][size_idx]
+        size_bytes = self._rng.randint(selected_range[0], selected_range[1])
 
         return file_type, size_bytes
 
@@ -401,42 +731,20 @@ class UserSimulator:
         file_type, _ = self.select_file_type_and_size()
         return file_type
 
-    def generate_file(self, file_type, size_bytes, filename):
+    def generate_file(self, file_type, size_bytes, filename, target_dir=None):
         """Generate a file with specific type and size - RACE CONDITION PROTECTED"""
-        file_path = os.path.join(self.user_temp_dir, filename)
+        file_path = os.path.join(target_dir or self.user_temp_dir, filename)
 
         # 🔥 CRITICAL FIX: Register operation before file creation
         register_operation(file_path, 'generate', self.user_id)
 
         try:
-            if file_type == 'code':
-                content = self.generate_code_content(size_bytes)
-                with open(file_path, 'w') as f:
-                    f.write(content)
-            elif file_type == 'documents':
-                content = self.generate_document_content(size_bytes)
-                with open(file_path, 'w') as f:
-                    f.write(content)
+            if file_type in ('code', 'documents'):
+                # 🚀 NEW: Text generation is CPU-bound, run it in a content worker process
+                write_text_file(file_path, file_type, size_bytes, self.user_id, self.user_config.description)
             else:
                 # Generate binary content for images, archives, media
-                with open(file_path, 'wb') as f:
-                    chunk_size = min(8192, size_bytes)
-                    remaining = size_bytes
-                    while remaining > 0:
-                        chunk = os.urandom(min(chunk_size, remaining))
-                        f.write(chunk)
-                        remaining -= len(chunk)
-
-            # Update stats
-            with stats_lock:
-                global_stats['files_created'] += 1
-                user_stats[self.user_id]['files_created'] += 1
-
-                # Check if it's a large file
-                size_mb = size_bytes / (1024 * 1024)
-                if size_mb > TTL_CONFIG['large_file_threshold_mb']:
-                    global_stats['large_files_created'] += 1
-                    user_stats[self.user_id]['large_files'] += 1
+                write_binary_file(file_path, size_bytes)
 
             return file_path
 
@@ -445,51 +753,88 @@ class UserSimulator:
             return None
         finally:
             # 🔥 CRITICAL FIX: Always unregister operation
-            unregister_operation(file_path)
+            unregister_operation(file_path, self.user_id)
 
-    def generate_code_content(self, size_bytes):
-        """Generate realistic code content"""
-        code_templates = [
-            "def function_{}():\n    '''Generated function for {user}'''\n    return {}\n\n",
-            "class Class{}:\n    def __init__(self):\n        self.{user}_value = {}\n\n",
-            "# {user} - {desc}\n# This is a comment about {}\nvar_{} = {}\n\n",
-            "import {}\nfrom {} import {}\n# {user} imports\n\n"
-        ]
+    def count_created_file(self, size_bytes):
+        """Update file creation stats"""
+        self._local_stats['files_created'] += 1
 
-        content = f"# Generated code file for {self.user_id}\n# {self.user_config['description']}\n\n"
-        while len(content.encode()) < size_bytes:
-            template = random.choice(code_templates)
-            content += template.format(
-                random.randint(1, 1000),
-                random.randint(1, 1000),
-                random.randint(1, 1000),
-                user=self.user_id,
-                desc=self.user_config['description']
-            )
+        # Check if it's a large file
+        size_mb = size_bytes / (1024 * 1024)
+        if size_mb > TTL_CONFIG['large_file_threshold_mb']:
+            self._local_stats['large_files'] += 1
+
+    def get_pooled_payload(self, file_type, size_idx):
+        """Return a (pool_path, size_bytes) payload, generating a new one while the pool is filling
+
+        Returns None when the caller should write a file for this upload only: the
+        largest size range of each type (tens to hundreds of MB) is never pooled,
+        and the pool stops growing at payload_pool_max_mb.
+        """
+        global payload_pool_bytes
+        sizes = FILE_TYPES[file_type]['sizes']
+        if size_idx >= len(sizes) - 1:
+            return None
 
-        return content[:size_bytes]
+        selected_range = sizes[size_idx]
+        size_bytes = self._rng.randint(selected_range[0], selected_range[1])
 
-    def generate_document_content(self, size_bytes):
-        """Generate realistic document content"""
-        words = [
-            "data", "analysis", "report", "summary", "business", "metrics",
-            "performance", "optimization", "cloud", "storage", "transfer",
-            "monitoring", "dashboard", "analytics", "insights", "trends",
-            self.user_id, "project", "research", "development"
-        ]
+        pool_key = (file_type, size_idx)
+        with payload_pool_lock:
+            pooled = payload_pool.setdefault(pool_key, [])
+            if (len(pooled) >= HIGH_VOLUME_CONFIG['payload_pool_size'] or
+                    payload_pool_bytes + size_bytes > HIGH_VOLUME_CONFIG['payload_pool_max_mb'] * 1024 * 1024):
+                ready = [payload for payload in pooled if payload]
+                return self._rng.choice(ready) if ready else None
+            slot = len(pooled)
+            pooled.append(None)  # Reserve the slot so concurrent users don't overfill it
+            payload_pool_bytes += size_bytes
 
-        content = f"Document by {self.user_id}\n"
-        content += f"Department: {self.user_config['description']}\n\n"
+        os.makedirs(PAYLOAD_POOL_DIR, exist_ok=True)
 
-        while len(content.encode()) < size_bytes:
-            sentence_length = random.randint(5, 15)
-            sentence = " ".join(random.choices(words, k=sentence_length))
-            content += sentence.capitalize() + ". "
+        pool_name = f"{file_type}_{size_idx}_{slot}.bin"
+        pool_path = self.generate_file(file_type, size_bytes, pool_name, PAYLOAD_POOL_DIR)
 
-            if random.random() < 0.1:
-                content += "\n\n"
+        with payload_pool_lock:
+            if pool_path:
+                add_pooled_payload(pooled, slot, pool_path, size_bytes)
+            else:
+                pooled.remove(None)
+                payload_pool_bytes -= size_bytes
+        return (pool_path, size_bytes) if pool_path else None
 
-        return content[:size_bytes]
+    def stage_pooled_file(self, file_type, size_idx, filename, target_dir):
+        """Hardlink a pooled payload into the batch directory, returns (local_path, size_bytes)"""
+        payload = self.get_pooled_payload(file_type, size_idx)
+
+        if payload:
+            pool_path, size_bytes = payload
+            local_path = os.path.join(target_dir, filename)
+            try:
+                os.link(pool_path, local_path)
+            except OSError:
+                # Filesystem without hardlinks - fall back to a fresh file
+                local_path = self.generate_file(file_type, size_bytes, filename, target_dir)
+        else:
+            # Unpooled range, pool full, or slots still being generated by other users -
+            # this file lives in the batch directory and goes with it after the upload
+            selected_range = FILE_TYPES[file_type]['sizes'][size_idx]
+            size_bytes = self._rng.randint(selected_range[0], selected_range[1])
+            local_path = self.generate_file(file_type, size_bytes, filename, target_dir)
+
+        if not local_path:
+            return None, 0
+
+        self.count_created_file(size_bytes)
+        return local_path, size_bytes
+
+    def generate_code_content(self, size_bytes):
+        """Generate realistic code content"""
+        return build_code_content(size_bytes, self.user_id, self.user_config.description)
+
+    def generate_document_content(self, size_bytes):
+        """Generate realistic document content"""
+        return build_document_content(size_bytes, self.user_id, self.user_config.description)
 
     def apply_ttl_policy(self, file_path, size_bytes):
         """Apply TTL policy based on file size"""
@@ -502,11 +847,10 @@ class UserSimulator:
             ttl_hours = TTL_CONFIG['regular_files_hours']
             self.logger.info(f"Regular file ({size_mb:.1f}MB) - TTL: {ttl_hours} hours")
 
-        with stats_lock:
-            global_stats['ttl_policies_applied'] += 1
+        self._local_stats['ttl_policies_applied'] += 1
 
     def upload_operation(self):
-        """Perform upload operation - RACE CONDITION PROTECTED"""
+        """Stage a generated file for upload - uploads are sent in batches by flush_uploads"""
         # 🚀 ENHANCED: Check if we should stop due to target reached or disk space
         if self.total_files_created >= HIGH_VOLUME_CONFIG['target_files_per_bucket']:
             self.logger.info(f"Target of {HIGH_VOLUME_CONFIG['target_files_per_bucket']} files reached. Slowing down.")
@@ -516,236 +860,338 @@ class UserSimulator:
             self.logger.warning("Stopping upload due to low disk space.")
             return False
 
-        file_type, size_bytes = self.select_file_type_and_size()
-        extension = random.choice(FILE_TYPES[file_type]['extensions'])
+        file_type, size_idx = self.select_file_type_and_size_range()
+        extension = self._rng.choice(FILE_TYPES[file_type]['extensions'])
 
         # 🚀 NEW: Generate subfolder path
         subfolder_path = self.generate_subfolder_path()
 
+        # Sequence number keeps names unique within a batch
         timestamp = int(time.time())
-        filename = f"{self.user_id}_{file_type}_{timestamp}{extension}"
+        self.upload_seq += 1
+        filename = f"{self.user_id}_{file_type}_{timestamp}_{self.upload_seq}{extension}"
+
+        # 🚀 NEW: Generate the file directly at its object key inside the batch directory
+        batch_dir = self.get_batch_dir()
+        target_dir = os.path.join(batch_dir, subfolder_path) if subfolder_path else batch_dir
+        os.makedirs(target_dir, exist_ok=True)
 
-        # Generate file
-        local_path = self.generate_file(file_type, size_bytes, filename)
+        local_path, size_bytes = self.stage_pooled_file(file_type, size_idx, filename, target_dir)
         if not local_path:
-            with stats_lock:
-                global_stats['errors'] += 1
-                user_stats[self.user_id]['errors'] += 1
+            self._local_stats['errors'] += 1
             return False
 
-        # 🔥 CRITICAL FIX: Register upload operation before starting
+        # 🔥 CRITICAL FIX: Register upload operation before staging
         register_operation(local_path, 'upload', self.user_id)
+        self.pending_uploads.append((local_path, subfolder_path, size_bytes))
 
-        try:
-            # 🚀 NEW: Upload to subfolder path in user's bucket
-            if subfolder_path:
-                s3_path = f"s3://{self.bucket}/{subfolder_path}/{filename}"
-            else:
-                s3_path = f"s3://{self.bucket}/{filename}"
+        if len(self.pending_uploads) >= HIGH_VOLUME_CONFIG['upload_batch_size']:
+            return self.flush_uploads()
 
-            success = self.run_obsctl_command(['cp', local_path, s3_path])
+        return True
 
-            if success:
-                # 🚀 NEW: Track files per subfolder
-                if subfolder_path:
-                    self.files_per_subfolder[subfolder_path] = self.files_per_subfolder.get(subfolder_path, 0) + 1
+    def get_batch_dir(self):
+        """Get the staging directory of the current upload batch"""
+        if self.batch_dir is None:
+            self.batch_seq += 1
+            self.batch_dir = os.path.join(self.user_temp_dir, f"batch_{int(time.time())}_{self.batch_seq}")
+            self.batch_started = time.time()
+        return self.batch_dir
+
+    def upload_batch_due(self):
+        """Check if the pending upload batch has waited long enough to be flushed"""
+        return (bool(self.pending_uploads) and
+                time.time() - self.batch_started >= HIGH_VOLUME_CONFIG['upload_batch_max_age_seconds'])
+
+    def flush_uploads(self):
+        """🚀 NEW: Start uploading all staged files with a single recursive obsctl cp
+
+        One obsctl process (startup, config, credentials, connection setup) is
+        shared by the whole batch. The staging directory mirrors the object keys,
+        so the recursive copy lands every file at its subfolder path. The upload
+        runs in the background and is completed by finish_batch once reaped.
+        """
+        if not self.pending_uploads:
+            return True
 
-                self.total_files_created += 1
+        batch, self.pending_uploads = self.pending_uploads, []
+        batch_dir, self.batch_dir = self.batch_dir, None
 
-                with stats_lock:
-                    global_stats['uploads'] += 1
-                    global_stats['operations'] += 1
-                    global_stats['bytes_transferred'] += size_bytes
-                    user_stats[self.user_id]['uploads'] += 1
-                    user_stats[self.user_id]['operations'] += 1
-                    user_stats[self.user_id]['bytes_transferred'] += size_bytes
+        return self.start_obsctl_command(
+            ['cp', batch_dir, self._bucket_uri, '--recursive'],
+            HIGH_VOLUME_CONFIG['upload_batch_timeout_seconds'],
+            lambda success: self.finish_batch(batch, batch_dir, success)
+        )
 
-                self.apply_ttl_policy(local_path, size_bytes)
+    def finish_batch(self, batch, batch_dir, success):
+        """Record a finished batch upload and remove its staged files"""
+        try:
+            if success:
+                batch_bytes = 0
+                for local_path, subfolder_path, size_bytes in batch:
+                    # 🚀 NEW: Track files per subfolder
+                    if subfolder_path:
+                        self.files_per_subfolder[subfolder_path] = self.files_per_subfolder.get(subfolder_path, 0) + 1
+                    batch_bytes += size_bytes
+                    self.apply_ttl_policy(local_path, size_bytes)
 
-                # 🚀 ENHANCED: Better logging with subfolder info
-                if subfolder_path:
-                    self.logger.info(f"Uploaded {subfolder_path}/{filename} ({size_bytes} bytes) [Total: {self.total_files_created}]")
-                else:
-                    self.logger.info(f"Uploaded {filename} ({size_bytes} bytes) [Total: {self.total_files_created}]")
+                self.total_files_created += len(batch)
 
-        finally:
-            # 🔥 CRITICAL FIX: Always unregister and cleanup, but check if file still exists
-            unregister_operation(local_path)
+                self._local_stats['uploads'] += len(batch)
+                self._local_stats['operations'] += len(batch)
+                self._local_stats['bytes_transferred'] += batch_bytes
 
-            # Only remove file if it still exists and isn't being used by another operation
-            try:
-                if os.path.exists(local_path) and not is_file_in_use(local_path):
-                    os.remove(local_path)
-            except Exception as e:
-                self.logger.debug(f"File cleanup warning: {e}")
+                self.logger.info(f"Uploaded batch of {len(batch)} files ({batch_bytes} bytes) [Total: {self.total_files_created}]")
 
-        return success
+        finally:
+            # 🔥 CRITICAL FIX: Always unregister and cleanup - staged files belong to this batch only
+            for local_path, _, _ in batch:
+                unregister_operation(local_path, self.user_id)
+            shutil.rmtree(batch_dir, ignore_errors=True)
+
+    def start_obsctl_command(self, args, timeout, on_done):
+        """🚀 NEW: Start an obsctl command in the background
+
+        Up to obsctl_ops_in_flight commands per user overlap; on_done(success)
+        runs in this user's thread once the command is reaped.
+        """
+        # Keep the number of concurrent obsctl commands bounded
+        self.reap_obsctl_commands()
+        while len(self.inflight_ops) >= HIGH_VOLUME_CONFIG['obsctl_ops_in_flight']:
+            self.finish_obsctl_command(*self.inflight_ops.pop(0), wait=True)
 
-    def download_operation(self):
-        """Perform download operation"""
+        cmd = [OBSCTL_BINARY] + args
+        stderr_file = tempfile.TemporaryFile(mode='w+')
         try:
-            # List files in user's bucket
-            result = subprocess.run(
-                [OBSCTL_BINARY, 'ls', f's3://{self.bucket}/'],
-                capture_output=True,
+            process = subprocess.Popen(
+                cmd,
+                stdout=OBSCTL_DEVNULL,
+                stderr=stderr_file,
                 text=True,
-                timeout=30,
-                env=dict(os.environ)
+                env=self._env,
+                close_fds=OBSCTL_CLOSE_FDS
             )
+        except Exception as e:
+            self.logger.error(f"Command exception: {e}")
+            self._local_stats['errors'] += 1
+            stderr_file.close()
+            on_done(False)
+            return False
 
-            if result.returncode != 0:
-                return False
+        self.inflight_ops.append((process, stderr_file, time.time(), timeout, on_done))
+        return True
 
-            lines = result.stdout.strip().split('\n')
-            if not lines or len(lines) < 2:
-                return False
+    def reap_obsctl_commands(self, wait=False):
+        """Complete finished background obsctl commands, or all of them when wait is set"""
+        still_running = []
+        for inflight in self.inflight_ops:
+            process, _, started, timeout, _ = inflight
+            if wait or time.time() - started > timeout or process.poll() is not None:
+                self.finish_obsctl_command(*inflight, wait=wait)
+            else:
+                still_running.append(inflight)
+        self.inflight_ops = still_running
 
-            # Pick a random file to download
-            file_line = random.choice(lines[1:])
-            if not file_line.strip():
-                return False
+    def finish_obsctl_command(self, process, stderr_file, started, timeout, on_done, wait=False):
+        """Wait for a background obsctl command and hand its outcome to on_done"""
+        cmd = ' '.join(process.args)
+        success = False
+        try:
+            remaining = timeout - (time.time() - started)
+            try:
+                returncode = process.wait(timeout=max(0, remaining) if wait else 0)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                self.logger.error(f"Command timeout: {cmd}")
+                self._local_stats['errors'] += 1
+                return
+
+            if returncode != 0:
+                stderr_file.seek(0)
+                self.logger.warning(f"Command failed: {cmd}")
+                self.logger.warning(f"Error: {stderr_file.read()}")
+                self._local_stats['errors'] += 1
+                return
+
+            success = True
+
+        finally:
+            stderr_file.close()
+            on_done(success)
+
+    def get_bucket_listing(self):
+        """Return object names in the user's bucket, refreshing the cached listing when stale"""
+        if time.time() - self.listing_fetched < HIGH_VOLUME_CONFIG['listing_cache_seconds']:
+            return self.listing_cache
+
+        # List files in user's bucket
+        result = subprocess.run(
+            [OBSCTL_BINARY, 'ls', self._bucket_uri],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env=self._env,
+            close_fds=OBSCTL_CLOSE_FDS
+        )
 
+        if result.returncode != 0:
+            return []
+
+        filenames = []
+        for file_line in result.stdout.strip().split('\n')[1:]:
             parts = file_line.strip().split()
-            if len(parts) < 4:
+            if len(parts) >= 4:
+                filenames.append(parts[-1])
+
+        self.listing_cache = filenames
+        self.listing_fetched = time.time()
+        return filenames
+
+    def download_operation(self):
+        """Start a download operation - completed by finish_download once reaped"""
+        try:
+            filenames = self.get_bucket_listing()
+            if not filenames:
                 return False
 
-            filename = parts[-1]
-            s3_path = f"s3://{self.bucket}/{filename}"
-            local_path = os.path.join(self.user_temp_dir, f"downloaded_{filename}")
+            # Pick a random file to download
+            filename = self._rng.choice(filenames)
+            s3_path = self._bucket_uri + filename
+            # Sequence number keeps overlapping downloads of one object apart
+            self.download_seq += 1
+            local_path = os.path.join(self.user_temp_dir, f"downloaded_{self.download_seq}_{filename}")
 
             # 🔥 CRITICAL FIX: Register download operation
             register_operation(local_path, 'download', self.user_id)
 
-            try:
-                # Download file
-                success = self.run_obsctl_command(['cp', s3_path, local_path])
-
-                if success:
-                    try:
-                        file_size = os.path.getsize(local_path)
-                        with stats_lock:
-                            global_stats['downloads'] += 1
-                            global_stats['operations'] += 1
-                            global_stats['bytes_transferred'] += file_size
-                            user_stats[self.user_id]['downloads'] += 1
-                            user_stats[self.user_id]['operations'] += 1
-                            user_stats[self.user_id]['bytes_transferred'] += file_size
-
-                        self.logger.info(f"Downloaded {filename} ({file_size} bytes)")
-
-                        # Clean up downloaded file immediately
-                        if os.path.exists(local_path):
-                            os.remove(local_path)
-                    except Exception as e:
-                        self.logger.debug(f"Download cleanup warning: {e}")
-
-            finally:
-                # 🔥 CRITICAL FIX: Always unregister operation
-                unregister_operation(local_path)
-
-            return success
+            return self.start_obsctl_command(
+                ['cp', s3_path, local_path],
+                120,
+                lambda success: self.finish_download(filename, local_path, success)
+            )
 
         except Exception as e:
             self.logger.error(f"Download operation failed: {e}")
-            with stats_lock:
-                global_stats['errors'] += 1
-                user_stats[self.user_id]['errors'] += 1
+            self._local_stats['errors'] += 1
             return False
 
-    def run_obsctl_command(self, args):
+    def finish_download(self, filename, local_path, success):
+        """Record a finished download and remove the downloaded file"""
+        try:
+            if success:
+                try:
+                    file_size = os.path.getsize(local_path)
+                    self._local_stats['downloads'] += 1
+                    self._local_stats['operations'] += 1
+                    self._local_stats['bytes_transferred'] += file_size
+
+                    self.logger.info(f"Downloaded {filename} ({file_size} bytes)")
+                except Exception as e:
+                    self.logger.debug("Download stats warning: %s", e)
+            else:
+                # Object may have expired since the listing was cached
+                self.listing_fetched = 0
+
+        finally:
+            # Clean up downloaded (or partially downloaded) file immediately - this
+            # thread registered it, so nobody else can be using it
+            try:
+                os.remove(local_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.debug("Download cleanup warning: %s", e)
+
+            # 🔥 CRITICAL FIX: Always unregister operation
+            unregister_operation(local_path, self.user_id)
+
+    def run_obsctl_command(self, args, timeout=120):
         """Run obsctl command with proper environment"""
         cmd = [OBSCTL_BINARY] + args
         try:
-            env = dict(os.environ)
-            env.update(OBSCTL_ENV)
-
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=120,
-                env=env
+                timeout=timeout,
+                env=self._env,
+                close_fds=OBSCTL_CLOSE_FDS
             )
 
             if result.returncode != 0:
                 self.logger.warning(f"Command failed: {' '.join(cmd)}")
                 self.logger.warning(f"Error: {result.stderr}")
-                with stats_lock:
-                    global_stats['errors'] += 1
-                    user_stats[self.user_id]['errors'] += 1
+                self._local_stats['errors'] += 1
                 return False
 
             return True
 
         except subprocess.TimeoutExpired:
             self.logger.error(f"Command timeout: {' '.join(cmd)}")
-            with stats_lock:
-                global_stats['errors'] += 1
-                user_stats[self.user_id]['errors'] += 1
+            self._local_stats['errors'] += 1
             return False
         except Exception as e:
             self.logger.error(f"Command exception: {e}")
-            with stats_lock:
-                global_stats['errors'] += 1
-                user_stats[self.user_id]['errors'] += 1
+            self._local_stats['errors'] += 1
             return False
 
     def ensure_bucket_exists(self):
         """Smart bucket creation - only create if not already done"""
-        global created_buckets
-
+        # 🚀 NEW: Claim the bucket under a short-held lock; mb itself runs outside it
         with bucket_creation_lock:
-            if self.bucket in created_buckets:
-                self.logger.debug(f"Bucket {self.bucket} already created, skipping")
-                return True
-
-            # Check if bucket exists by listing it
-            try:
-                env = dict(os.environ)
-                env.update(OBSCTL_ENV)
-
-                result = subprocess.run(
-                    [OBSCTL_BINARY, 'ls', f's3://{self.bucket}/'],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    env=env
-                )
-
-                if result.returncode == 0:
-                    # Bucket exists
-                    created_buckets.add(self.bucket)
-                    self.logger.debug(f"Bucket {self.bucket} already exists")
-                    return True
-
-            except Exception as e:
-                self.logger.debug(f"Error checking bucket existence: {e}")
+            ready = bucket_ready.get(self.bucket)
+            creator = ready is None
+            if creator:
+                ready = bucket_ready[self.bucket] = Event()
+
+        if not creator:
+            if not ready.wait(timeout=BUCKET_CREATION_WAIT):
+                self.logger.warning(f"Timed out waiting for bucket {self.bucket} to be created")
+            else:
+                self.logger.debug("Bucket %s already created, skipping", self.bucket)
+            return True
 
-            # Bucket doesn't exist, create it
-            self.logger.info(f"Creating bucket: {self.bucket}")
-            success = self.run_obsctl_command(['mb', f's3://{self.bucket}'])
+        # 🚀 NEW: One mb call - an existing bucket only makes it fail, so no ls pre-check
+        self.logger.info(f"Creating bucket: {self.bucket}")
+        try:
+            result = subprocess.run(
+                [OBSCTL_BINARY, 'mb', self._bucket_uri_noslash],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                env=self._env,
+                close_fds=OBSCTL_CLOSE_FDS
+            )
 
-            if success:
-                created_buckets.add(self.bucket)
+            if result.returncode == 0:
                 self.logger.info(f"Successfully created bucket: {self.bucket}")
+            elif any(code in result.stderr for code in BUCKET_EXISTS_ERRORS):
+                self.logger.debug("Bucket %s already exists", self.bucket)
             else:
-                # Check if error was "BucketAlreadyOwnedByYou" which is actually success
-                self.logger.debug(f"Bucket creation command failed, but bucket might already exist")
-                created_buckets.add(self.bucket)  # Assume it exists
+                self.logger.debug("Bucket creation command failed, but bucket might already exist: %s", result.stderr.strip())
 
-            return True
+        except Exception as e:
+            self.logger.debug("Error creating bucket: %s", e)
+
+        finally:
+            ready.set()  # Assume it exists
+
+        return True
 
     def run(self):
         """Main user simulation loop - GRACEFUL SHUTDOWN ENABLED"""
-        global running
-
-        self.logger.info(f"Starting user simulation: {self.user_config['description']}")
+        self.logger.info(f"Starting user simulation: {self.user_config.description}")
 
         # Create user's bucket
         self.ensure_bucket_exists()
 
+        # Bound once - these are drawn on every iteration of the loop
+        uniform = self._rng.uniform
+        rand = self._rng.random
+
         try:
-            while running and not shutdown_event.is_set():
+            while not shutdown_event.is_set():
                 try:
                     # Calculate current activity level
                     activity_level = self.get_current_activity_level()
@@ -753,39 +1199,45 @@ class UserSimulator:
                     # Determine operation interval for high-volume traffic
                     if activity_level > 1.0:  # Peak hours - high volume
                         # Use configured peak volume settings
-                        ops_per_min = random.uniform(PEAK_VOLUME_MIN, PEAK_VOLUME_MAX)
+                        ops_per_min = uniform(PEAK_VOLUME_MIN, PEAK_VOLUME_MAX)
                         base_interval = 60.0 / ops_per_min
                     else:  # Off hours - moderate volume
                         # Use configured off-peak volume settings
-                        ops_per_min = random.uniform(OFF_PEAK_VOLUME_MIN, OFF_PEAK_VOLUME_MAX)
+                        ops_per_min = uniform(OFF_PEAK_VOLUME_MIN, OFF_PEAK_VOLUME_MAX)
                         base_interval = 60.0 / ops_per_min
 
                     # Add some randomness for realistic patterns
-                    interval = random.uniform(base_interval * 0.5, base_interval * 1.5)
+                    interval = uniform(base_interval * 0.5, base_interval * 1.5)
 
                     # Select operation type (80% upload, 20% download)
-                    if random.random() < 0.8:
+                    if rand() < 0.8:
                         self.upload_operation()
                     else:
                         self.download_operation()
 
-                    # 🔥 CRITICAL FIX: Check for shutdown during wait
-                    # Wait before next operation, but check for shutdown periodically
-                    sleep_chunks = max(1, int(interval))
-                    for _ in range(sleep_chunks):
-                        if shutdown_event.is_set():
-                            break
-                        time.sleep(min(1.0, interval / sleep_chunks))
+                    # 🚀 NEW: Don't let a slow trickle of uploads sit in staging forever
+                    if self.upload_batch_due():
+                        self.flush_uploads()
+                    self.reap_obsctl_commands()
+
+                    # 🔥 CRITICAL FIX: Wait before next operation, waking at once on shutdown
+                    if shutdown_event.wait(timeout=interval):
+                        break
 
                 except Exception as e:
                     self.logger.error(f"User simulation error: {e}")
-                    # Wait before retry, but check for shutdown
-                    for _ in range(30):
-                        if shutdown_event.is_set():
-                            break
-                        time.sleep(1)
+                    # Wait before retry, but wake at once on shutdown
+                    if shutdown_event.wait(timeout=30):
+                        break
 
         finally:
+            # 🚀 NEW: Upload whatever is still staged and wait for in-flight batches
+            try:
+                self.flush_uploads()
+                self.reap_obsctl_commands(wait=True)
+            except Exception as e:
+                self.logger.warning(f"Failed to flush pending uploads: {e}")
+
             # 🔥 CRITICAL FIX: Wait for all operations to complete before cleanup
             self.logger.info(f"User {self.user_id} shutting down, waiting for operations to complete...")
 
@@ -797,16 +1249,7 @@ class UserSimulator:
             try:
                 if os.path.exists(self.user_temp_dir):
                     # Only remove files that aren't in active operations
-                    files_removed = 0
-                    for root, dirs, files in os.walk(self.user_temp_dir):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            if not is_file_in_use(file_path):
-                                try:
-                                    os.remove(file_path)
-                                    files_removed += 1
-                                except:
-                                    pass
+                    files_removed, _ = remove_unused_files(self.user_temp_dir, self.user_id)
 
                     # Try to remove directory if empty
                     try:
@@ -820,6 +1263,7 @@ class UserSimulator:
 
             # Signal that this user has stopped
             self.user_stopped.set()
+            users_done.release()
 
         self.logger.info("User simulation stopped")
 
@@ -831,6 +1275,7 @@ class ConcurrentTrafficGenerator:
         self.setup_logging()
         self.setup_environment()
         self.user_threads = []
+        self.user_simulators = []
 
     def setup_logging(self):
         """Setup main logging"""
@@ -844,13 +1289,33 @@ class ConcurrentTrafficGenerator:
 
         console_handler = logging.StreamHandler(sys.stdout)
 
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler.setFormatter(formatter)
+        console_handler.setFormatter(formatter)
+
+        # 🚀 NEW: File and console I/O happens on listener threads, not in user threads
+        user_stream_handler = logging.StreamHandler()
+        user_stream_handler.setFormatter(logging.Formatter('%(message)s'))
+        self.log_listeners = [
+            QueueListener(log_queue, file_handler, console_handler),
+            QueueListener(user_log_queue, user_stream_handler),
+        ]
+        for listener in self.log_listeners:
+            listener.start()
+
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Listener handlers add the prefix
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[file_handler, console_handler]
+            handlers=[queue_handler]
         )
         self.logger = logging.getLogger(__name__)
 
+    def stop_logging(self):
+        """Flush queued log records and stop the listener threads"""
+        for listener in self.log_listeners:
+            listener.stop()
+
     def setup_environment(self):
         """Setup directories and environment"""
         os.makedirs(TEMP_DIR, exist_ok=True)
@@ -861,8 +1326,56 @@ class ConcurrentTrafficGenerator:
 
         self.logger.info(f"Environment setup complete for {len(USERS)} concurrent users")
 
+    def aggregate_stats(self):
+        """Fold every user's local counters into user_stats and global_stats"""
+        # Counters are cumulative and only grow, so a snapshot is always consistent
+        snapshots = {sim.user_id: dict(sim._local_stats) for sim in self.user_simulators}
+
+        with stats_lock:
+            for user_id, snapshot in snapshots.items():
+                user_stats[user_id] = snapshot
+            for key, source in GLOBAL_STAT_SOURCES.items():
+                global_stats[key] = sum(snapshot[source] for snapshot in snapshots.values())
+
+    def prewarm_payload_pool(self):
+        """Fill the smallest size range of every file type on all content workers before users start"""
+        global payload_pool_bytes
+        os.makedirs(PAYLOAD_POOL_DIR, exist_ok=True)
+        rng = random.Random()
+        user_ids = list(USERS)
+        jobs = []
+
+        for file_type, file_config in FILE_TYPES.items():
+            low, high = file_config['sizes'][0]
+            for slot in range(HIGH_VOLUME_CONFIG['payload_pool_size']):
+                user_id = user_ids[slot % len(user_ids)]
+                size_bytes = rng.randint(low, high)
+                pool_path = os.path.join(PAYLOAD_POOL_DIR, f"{file_type}_0_{slot}.bin")
+                future = content_executor.submit(
+                    _write_payload_file, pool_path, file_type, size_bytes, user_id, USERS[user_id].description
+                )
+                jobs.append((file_type, pool_path, size_bytes, future))
+
+        prewarmed = 0
+        for file_type, pool_path, size_bytes, future in jobs:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.warning(f"Failed to prewarm payload {pool_path}: {e}")
+                continue
+            with payload_pool_lock:
+                pooled = payload_pool.setdefault((file_type, 0), [])
+                pooled.append(None)
+                add_pooled_payload(pooled, len(pooled) - 1, pool_path, size_bytes)
+                payload_pool_bytes += size_bytes
+            prewarmed += 1
+
+        self.logger.info(f"Prewarmed payload pool with {prewarmed} files")
+
     def print_stats(self):
         """Print comprehensive statistics including disk space monitoring"""
+        self.aggregate_stats()
+
         # 🚀 NEW: Get current disk space
         free_gb = get_disk_free_space_gb()
 
@@ -925,7 +1438,7 @@ class ConcurrentTrafficGenerator:
 
     def run(self):
         """Main traffic generation loop with concurrent users - GRACEFUL SHUTDOWN"""
-        global running
+        global content_executor
 
         self.logger.info(f"Starting concurrent traffic generator for {SCRIPT_DURATION_HOURS} hours")
         self.logger.info(f"MinIO endpoint: {MINIO_ENDPOINT}")
@@ -936,14 +1449,20 @@ class ConcurrentTrafficGenerator:
         start_time = time.time()
 
         # 🔥 CRITICAL FIX: Setup signal handler for graceful shutdown
-        def signal_handler(signum, frame):
-            self.logger.info("Received shutdown signal, stopping all users...")
-            global running
-            running = False
-            shutdown_event.set()  # Signal all threads to stop
+        signal.signal(signal.SIGINT, handle_shutdown_signal)
+        signal.signal(signal.SIGTERM, handle_shutdown_signal)
+
+        # 🚀 NEW: User threads spend their time waiting on obsctl, but text content
+        # generation is pure Python - give it real cores via a process pool
+        content_workers = max(1, min(MAX_CONCURRENT_USERS, os.cpu_count() or 1))
+        content_executor = ProcessPoolExecutor(max_workers=content_workers, initializer=_init_content_worker)
+        self.logger.info(f"Started {content_workers} content generation worker processes")
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        if HIGH_VOLUME_CONFIG['payload_pool_prewarm']:
+            self.prewarm_payload_pool()
+
+        # 🚀 NEW: One thread keeps the low disk space flag fresh for every user
+        start_disk_monitor(shutdown_event)
 
         # Start all user threads
         with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_USERS) as executor:
@@ -951,7 +1470,7 @@ class ConcurrentTrafficGenerator:
 
             # Submit all user simulations
             futures = []
-            user_simulators = []
+            user_simulators = self.user_simulators
             for user_id, user_config in USERS.items():
                 user_sim = UserSimulator(user_id, user_config)
                 user_simulators.append(user_sim)
@@ -961,44 +1480,55 @@ class ConcurrentTrafficGenerator:
 
             # Start stats reporting thread
             def stats_reporter():
-                while running and not shutdown_event.is_set():
+                while not shutdown_event.is_set():
                     # Wait 5 minutes or until shutdown
-                    for _ in range(300):
-                        if shutdown_event.is_set():
-                            break
-                        time.sleep(1)
+                    shutdown_event.wait(timeout=300)
 
-                    if running and not shutdown_event.is_set():
+                    if not shutdown_event.is_set():
                         self.print_stats()
 
             stats_thread = threading.Thread(target=stats_reporter, daemon=True)
             stats_thread.start()
 
+            # 🚀 NEW: Periodically publish the users' local counters
+            def stats_aggregator():
+                while not shutdown_event.wait(STATS_FLUSH_INTERVAL):
+                    self.aggregate_stats()
+
+            aggregator_thread = threading.Thread(target=stats_aggregator, daemon=True)
+            aggregator_thread.start()
+
             try:
                 # Wait for duration or until interrupted
                 end_time = start_time + (SCRIPT_DURATION_HOURS * 3600)
-                while time.time() < end_time and running and not shutdown_event.is_set():
-                    time.sleep(60)  # Check every minute
+                while time.time() < end_time and not shutdown_event.is_set():
+                    shutdown_event.wait(timeout=min(60, max(0, end_time - time.time())))  # Check every minute
 
             except KeyboardInterrupt:
                 self.logger.info("Received keyboard interrupt, shutting down...")
 
             finally:
                 # 🔥 CRITICAL FIX: Graceful shutdown sequence
-                running = False
                 shutdown_event.set()
 
                 # Wait for all user threads to complete gracefully
                 self.logger.info("Waiting for all user threads to stop...")
                 completed_users = []
 
-                for i, (future, user_sim) in enumerate(zip(futures, user_simulators)):
-                    try:
-                        future.result(timeout=45)  # Wait up to 45 seconds per thread
+                # One shared deadline - a hung user can't stretch shutdown per thread
+                deadline = time.time() + USER_SHUTDOWN_TIMEOUT
+                for _ in user_simulators:
+                    if not users_done.acquire(timeout=max(0, deadline - time.time())):
+                        break
+
+                for future, user_sim in zip(futures, user_simulators):
+                    if not user_sim.user_stopped.is_set():
+                        self.logger.warning(f"User {user_sim.user_id} did not stop within {USER_SHUTDOWN_TIMEOUT}s")
+                    elif future.done() and future.exception():
+                        self.logger.warning(f"User {user_sim.user_id} thread cleanup error: {future.exception()}")
+                    else:
                         completed_users.append(user_sim.user_id)
                         self.logger.info(f"User {user_sim.user_id} stopped gracefully")
-                    except Exception as e:
-                        self.logger.warning(f"User {user_sim.user_id} thread cleanup error: {e}")
 
                 self.logger.info(f"Completed shutdown for {len(completed_users)}/{len(USERS)} users")
 
@@ -1008,45 +1538,26 @@ class ConcurrentTrafficGenerator:
 
                 self.print_stats()
 
+                # Stop content workers once no user thread can submit to them
+                executor_to_stop, content_executor = content_executor, None
+                executor_to_stop.shutdown(wait=True)
+
+                # Pooled payloads are protected from cleanup while users may stage uploads
+                release_payload_pool()
+
                 # 🔥 CRITICAL FIX: Final cleanup only removes files NOT in active operations
                 try:
                     if os.path.exists(TEMP_DIR):
-                        remaining_files = []
-                        protected_files = []
-
-                        for root, dirs, files in os.walk(TEMP_DIR):
-                            for file in files:
-                                file_path = os.path.join(root, file)
-                                if is_file_in_use(file_path):
-                                    protected_files.append(file_path)
-                                else:
-                                    remaining_files.append(file_path)
-
-                        # Only remove files that aren't protected
-                        files_removed = 0
-                        for file_path in remaining_files:
-                            try:
-                                os.remove(file_path)
-                                files_removed += 1
-                            except:
-                                pass
-
-                        if protected_files:
-                            self.logger.warning(f"Protected {len(protected_files)} files still in use from cleanup")
+                        # Only remove files that aren't protected, and directories left empty
+                        files_removed, files_protected = remove_unused_files(TEMP_DIR)
+
+                        if files_protected:
+                            self.logger.warning(f"Protected {files_protected} files still in use from cleanup")
 
                         if files_removed > 0:
                             self.logger.info(f"Cleaned up remaining temporary files: {files_removed} files")
 
-                        # Try to remove empty directories
                         try:
-                            for root, dirs, files in os.walk(TEMP_DIR, topdown=False):
-                                for dir_name in dirs:
-                                    dir_path = os.path.join(root, dir_name)
-                                    try:
-                                        os.rmdir(dir_path)
-                                    except OSError:
-                                        pass  # Directory not empty
-
                             # Try to remove main temp directory
                             os.rmdir(TEMP_DIR)
                             self.logger.info("Removed temporary directory")
@@ -1057,6 +1568,7 @@ class ConcurrentTrafficGenerator:
                     self.logger.warning(f"Final cleanup warning: {e}")
 
                 self.logger.info("Concurrent traffic generator finished")
+                self.stop_logging()
 
 
 if __name__ == "__main__":
@@ -1068,11 +1580,11 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Acquire lock
-    lock_fd = acquire_lock()
+    acquire_lock()
 
     try:
         generator = ConcurrentTrafficGenerator()
         generator.run()
     finally:
         # Always release lock when exiting
-        release_lock(lock_fd)
+        release_lock()
@@ -2,7 +2,13 @@
 # This file contains all the configuration settings for the traffic generator
 # Keeping them separate prevents accidental overwrites during code changes
 
-import shutil
+import os
+import re
+import sys
+import threading
+import time
+from itertools import accumulate
+from types import MappingProxyType
 
 # Global Configuration
 TEMP_DIR = "/tmp/obsctl-traffic"
@@ -17,6 +23,7 @@ DISK_SPACE_CONFIG = {
     'stop_threshold_gb': 11,    # Stop generation when free space drops to 11GB
     'check_interval_seconds': 30, # Check disk space every 30 seconds
     'emergency_cleanup_gb': 5,  # Emergency cleanup if below 5GB
+    'cache_seconds': 5,         # Reuse a free space reading for 5 seconds
 }
 
 # 🚀 NEW: High-Volume Generation Settings
@@ -26,6 +33,14 @@ HIGH_VOLUME_CONFIG = {
     'max_subfolder_depth': 3,         # Up to 3 levels deep
     'files_per_subfolder': 200,       # 200 files per subfolder max
     'small_file_bias': 0.8,           # 80% small files for high object count
+    'upload_batch_size': 32,          # Files per obsctl cp --recursive invocation
+    'upload_batch_max_age_seconds': 30,  # Flush a partial batch after 30 seconds
+    'upload_batch_timeout_seconds': 600,  # Timeout for one batch upload
+    'obsctl_ops_in_flight': 4,        # Background obsctl commands a user may have running at once
+    'listing_cache_seconds': 60,      # Reuse a bucket listing for downloads for 60 seconds
+    'payload_pool_size': 8,           # Generated payloads kept per file type and size range
+    'payload_pool_max_mb': 1024,      # Total size of pooled payloads - the largest range of each type is never pooled
+    'payload_pool_prewarm': True,     # Generate the smallest size range of each type up front
 }
 
 # 🚀 NEW: Subfolder Structure Templates
@@ -121,6 +136,41 @@ SUBFOLDER_TEMPLATES = {
         'testing/{app}/automated'
     ]
 }
+# 🚀 NEW: Read-only at runtime - freeze so nothing can change the templates under a running user.
+# Bucket names are interned because every lookup keyed by them shares the same objects.
+SUBFOLDER_TEMPLATES = MappingProxyType({
+    sys.intern(bucket): tuple(templates) for bucket, templates in SUBFOLDER_TEMPLATES.items()
+})
+
+# 🚀 NEW: Templates split once into literal strings and (field_name,) placeholder tokens
+_TEMPLATE_FIELD = re.compile(r'\{([^}]+)\}')
+
+def _compile_template(template):
+    """Compile a subfolder template into a tuple of literals and (field_name,) tokens"""
+    segments = []
+    pos = 0
+    for match in _TEMPLATE_FIELD.finditer(template):
+        if match.start() > pos:
+            segments.append(template[pos:match.start()])
+        segments.append((match.group(1),))
+        pos = match.end()
+    if pos < len(template):
+        segments.append(template[pos:])
+    return tuple(segments)
+
+def template_fields(compiled):
+    """Placeholder names used by a compiled template"""
+    return frozenset(segment[0] for segment in compiled if not isinstance(segment, str))
+
+def render(compiled, values):
+    """Fill a compiled template from a field_name -> value mapping"""
+    return ''.join([segment if isinstance(segment, str) else values[segment[0]] for segment in compiled])
+
+COMPILED_SUBFOLDER_TEMPLATES = MappingProxyType({
+    bucket: tuple(_compile_template(template) for template in templates)
+    for bucket, templates in SUBFOLDER_TEMPLATES.items()
+})
+DEFAULT_SUBFOLDER_TEMPLATES = (_compile_template('files'),)
 
 # Traffic Volume Settings (operations per minute) - RAMPED UP FOR HIGH VOLUME
 PEAK_VOLUME_MIN = 500    # Minimum ops/min during peak hours (5x increase)
@@ -277,6 +327,23 @@ USER_CONFIGS = {
     }
 }
 
+# 🚀 NEW: Read-only at runtime - freeze the personas, including their file preferences
+USER_CONFIGS = MappingProxyType({
+    user_id: MappingProxyType({
+        **config,
+        'bucket': sys.intern(config['bucket']),
+        'file_preferences': MappingProxyType(config['file_preferences']),
+    })
+    for user_id, config in USER_CONFIGS.items()
+})
+
+# 🚀 NEW: Per-user (file_types, cumulative_weights) for weighted file type draws,
+# built once instead of per simulator
+FILE_PREFERENCE_TABLES = {
+    user_id: (tuple(config['file_preferences']), tuple(accumulate(config['file_preferences'].values())))
+    for user_id, config in USER_CONFIGS.items()
+}
+
 # File type extensions
 FILE_EXTENSIONS = {
     'code': ['.py', '.js', '.html', '.css', '.rs', '.go', '.java', '.cpp', '.c', '.json', '.xml', '.yaml', '.toml'],
@@ -286,6 +353,10 @@ FILE_EXTENSIONS = {
     'media': ['.mp4', '.avi', '.mov', '.mkv', '.mp3', '.wav', '.flac', '.ogg']
 }
 
+# 🚀 NEW: Extensions end every generated key and are used as dict keys - intern them once
+for category, exts in FILE_EXTENSIONS.items():
+    FILE_EXTENSIONS[category] = [sys.intern(ext) for ext in exts]
+
 # Environment variables for obsctl
 OBSCTL_ENV = {
     'OTEL_ENABLED': 'true',
@@ -296,17 +367,73 @@ OBSCTL_ENV = {
     'AWS_REGION': 'us-east-1'
 }
 
+def _build_obsctl_env():
+    """Environment for obsctl subprocesses
+
+    Built from os.environb where available, so subprocess gets bytes it can pass
+    to exec as-is instead of encoding every variable again on each spawn.
+    """
+    if not os.supports_bytes_environ:
+        env = dict(os.environ)
+        env.update(OBSCTL_ENV)
+        return env
+
+    env = dict(os.environb)
+    env.update((os.fsencode(key), os.fsencode(value)) for key, value in OBSCTL_ENV.items())
+    return env
+
+# 🚀 NEW: os.environ plus OBSCTL_ENV, built once at import and passed to every obsctl spawn
+BASE_OBSCTL_ENV = _build_obsctl_env()
+
+# 🚀 NEW: Free space readings shared by all callers for DISK_SPACE_CONFIG['cache_seconds'] -
+# the stop threshold leaves far more margin than a few seconds of writes
+_disk_space_cache = {}  # path -> (monotonic timestamp, free_gb)
+
+# 🚀 NEW: Mirrors the latest reading of "/" against stop_threshold_gb, kept fresh by the
+# disk monitor thread so should_stop_generation is a plain read
+_should_stop_flag = False
+_disk_monitor = None
+
 # 🚀 NEW: Helper function for disk space checking
-def get_disk_free_space_gb(path="/"):
-    """Get free disk space in GB for the given path"""
+def get_disk_free_space_gb(path="/", force=False):
+    """Get free disk space in GB for the given path - force bypasses the cached reading"""
+    global _should_stop_flag
+    now = time.monotonic()
+    cached = _disk_space_cache.get(path)
+    if cached and not force and now - cached[0] < DISK_SPACE_CONFIG['cache_seconds']:
+        return cached[1]
+
     try:
-        _, _, free_bytes = shutil.disk_usage(path)
-        return free_bytes / (1024**3)  # Convert to GB
+        # Same figure as shutil.disk_usage().free, without the namedtuple around it
+        stats = os.statvfs(path)
+        free_gb = stats.f_bavail * stats.f_frsize / (1024**3)  # Convert to GB
     except Exception:
-        return float('inf')  # If we can't check, assume infinite space
+        free_gb = float('inf')  # If we can't check, assume infinite space
+
+    _disk_space_cache[path] = (now, free_gb)
+    if path == "/":
+        _should_stop_flag = free_gb <= DISK_SPACE_CONFIG['stop_threshold_gb']
+    return free_gb
+
+def _poll_disk_space(stop_event):
+    """Refresh the free space reading of "/" every cache_seconds until stop_event is set"""
+    while True:
+        get_disk_free_space_gb(force=True)
+        if stop_event.wait(DISK_SPACE_CONFIG['cache_seconds']):
+            return
+
+def start_disk_monitor(stop_event):
+    """Start the background disk monitor that should_stop_generation reads from"""
+    global _disk_monitor
+    if _disk_monitor is not None and _disk_monitor.is_alive():
+        return
+    _disk_monitor = threading.Thread(target=_poll_disk_space, args=(stop_event,), name='disk-monitor', daemon=True)
+    _disk_monitor.start()
 
 def should_stop_generation():
     """Check if we should stop generation due to low disk space"""
+    if _disk_monitor is not None and _disk_monitor.is_alive():
+        return _should_stop_flag
     free_gb = get_disk_free_space_gb()
     return free_gb <= DISK_SPACE_CONFIG['stop_threshold_gb']
 
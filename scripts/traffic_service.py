@@ -8,28 +8,42 @@ It handles plist installation, service start/stop, and status checking.
 """
 
 import os
+import re
 import sys
 import subprocess
 import argparse
+import functools
+import time
 from pathlib import Path
 
 # Service configuration
 SERVICE_NAME = "com.obsctl.traffic-generator"
 PLIST_FILE = "com.obsctl.traffic-generator.plist"
 LOCK_FILE = "/tmp/obsctl-traffic-generator.lock"
+LOG_TAIL_BYTES = 4096  # Read at most this much from the end of a log file
 
+# "PID Status Label" row for the service in launchctl list output
+_STATUS_RE = re.compile(rf'^\s*(\S+)\s+\S+\s+\S*{re.escape(SERVICE_NAME)}', re.M)
+
+@functools.lru_cache(maxsize=1)
 def get_script_dir():
     """Get the directory where this script is located"""
     return Path(__file__).parent.absolute()
 
+@functools.lru_cache(maxsize=1)
 def get_plist_path():
     """Get the path to the plist file"""
     return get_script_dir() / PLIST_FILE
 
+@functools.lru_cache(maxsize=1)
 def get_user_agents_dir():
     """Get the user's LaunchAgents directory"""
     home = Path.home()
-    agents_dir = home / "Library" / "LaunchAgents"
+    return home / "Library" / "LaunchAgents"
+
+def ensure_agents_dir():
+    """Get the user's LaunchAgents directory, creating it if needed"""
+    agents_dir = get_user_agents_dir()
     agents_dir.mkdir(exist_ok=True)
     return agents_dir
 
@@ -40,7 +54,7 @@ def install_plist():
         print(f"ERROR: Plist file not found: {plist_source}")
         return False
 
-    agents_dir = get_user_agents_dir()
+    agents_dir = ensure_agents_dir()
     plist_dest = agents_dir / PLIST_FILE
 
     # Copy plist file
@@ -125,46 +139,62 @@ def get_service_status():
     if not plist_dest.exists():
         return "not_installed", "Plist not installed"
 
+    # A live lock file PID already answers the question without spawning launchctl
+    lock_exists, pid = check_lock_file()
+    if lock_exists:
+        return "running", f"Running (PID: {pid})"
+
     # Check launchctl list
     cmd = ["launchctl", "list", SERVICE_NAME]
     try:
         result = subprocess.run(cmd, capture_output=True, text=True)
         if result.returncode == 0:
             # Service is loaded, check if it's running
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if SERVICE_NAME in line:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        pid = parts[0]
-                        status = parts[1]
-                        if pid != "-":
-                            return "running", f"Running (PID: {pid})"
-                        else:
-                            return "loaded", "Loaded but not running"
+            match = _STATUS_RE.search(result.stdout)
+            if match:
+                pid = match.group(1)
+                if pid != "-":
+                    return "running", f"Running (PID: {pid})"
+                else:
+                    return "loaded", "Loaded but not running"
             return "loaded", "Loaded but status unclear"
         else:
             return "not_loaded", "Not loaded"
     except Exception as e:
         return "error", f"Error checking status: {e}"
 
+def read_log_tail(path, line_count=5):
+    """Return the last line_count lines of a log file without spawning tail"""
+    # One fstat and one positional read - no file object, buffering or seeks
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        start = max(0, size - LOG_TAIL_BYTES)
+        data = os.pread(fd, size - start, start)
+    finally:
+        os.close(fd)
+
+    lines = data.decode('utf-8', 'replace').splitlines()
+    if start > 0 and lines:
+        lines = lines[1:]  # First line is most likely cut off
+    return lines[-line_count:]
+
 def check_lock_file():
     """Check if the lock file exists and get PID"""
-    if os.path.exists(LOCK_FILE):
-        try:
-            with open(LOCK_FILE, 'r') as f:
-                pid = int(f.read().strip())
-
-            # Check if process is still running
-            try:
-                os.kill(pid, 0)  # Signal 0 just checks if process exists
-                return True, pid
-            except OSError:
-                # Process not running, stale lock file
-                return False, None
-        except:
-            return False, None
-    return False, None
+    # A missing or unreadable lock file is the same answer - no exists() check first
+    try:
+        with open(LOCK_FILE, 'r') as f:
+            pid = int(f.read().strip())
+    except (OSError, ValueError):
+        return False, None
+
+    # Check if process is still running
+    try:
+        os.kill(pid, 0)  # Signal 0 just checks if process exists
+        return True, pid
+    except OSError:
+        # Process not running, stale lock file
+        return False, None
 
 def status():
     """Show detailed status of the traffic generator"""
@@ -190,23 +220,23 @@ def status():
     ]
 
     print("\n📝 Log Files:")
+    found_logs = set()
     for log_file in log_files:
-        if os.path.exists(log_file):
+        try:
             stat = os.stat(log_file)
-            size_mb = stat.st_size / (1024 * 1024)
-            print(f"  {log_file}: {size_mb:.1f} MB")
-        else:
+        except FileNotFoundError:
             print(f"  {log_file}: Not found")
+            continue
+        found_logs.add(log_file)
+        size_mb = stat.st_size / (1024 * 1024)
+        print(f"  {log_file}: {size_mb:.1f} MB")
 
     # Show recent log entries if service is running
-    if service_status == "running" and os.path.exists("traffic_generator.log"):
+    if service_status == "running" and "traffic_generator.log" in found_logs:
         print("\n📋 Recent Activity (last 5 lines):")
         try:
-            result = subprocess.run(["tail", "-5", "traffic_generator.log"],
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    print(f"  {line}")
+            for line in read_log_tail("traffic_generator.log"):
+                print(f"  {line}")
         except:
             print("  Could not read log file")
 
@@ -229,7 +259,6 @@ def main():
     elif args.command == "restart":
         print("Restarting traffic generator service...")
         stop_service()
-        import time
         time.sleep(2)
         success = start_service()
         sys.exit(0 if success else 1)
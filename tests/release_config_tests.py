@@ -9,26 +9,33 @@ to extensive scope (2000+ test cases).
 Features:
 - UUID-based test files for GitHub Actions compatibility (small files)
 - Generator fan-out pattern for efficient test data management
-- Parallel execution with ThreadPoolExecutor
+- Parallel execution on a thread pool (default) or ProcessPoolExecutor
 - MinIO integration testing
 
 Usage:
     python tests/release_config_tests.py --category all
     python tests/release_config_tests.py --category credentials --workers 8
+    python tests/release_config_tests.py --category otel --executor process
 """
 
-import asyncio
 import argparse
+import functools
+import itertools
 import tempfile
 import os
+import re
 import subprocess
+import sys
+import threading
 import time
 import json
+import multiprocessing
 import shutil
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any, List, Generator, Tuple
+from typing import Optional, Dict, Any, List, Generator, Tuple, Iterator, Callable
 from pathlib import Path
 
 
@@ -71,21 +78,86 @@ class ConfigTestCase:
     expected_region: Optional[str]
 
 
+@dataclass(slots=True)
+class TestResult:
+    """Outcome of a single test, as sent back from the worker"""
+    test_id: str
+    category: str
+    status: str
+    execution_time: float
+    failures: Tuple[str, ...] = ()
+    otel_enabled: Optional[bool] = None
+    description: str = ''
+    error: Optional[str] = None
+
+
+# obsctl binary under test - OBSCTL_BIN if set, else the release build in this checkout.
+# Resolved once so tests don't depend on the cwd; main() exports it for the workers
+OBSCTL_BINARY = os.path.abspath(
+    os.environ.get("OBSCTL_BIN") or Path(__file__).resolve().parents[1] / "target" / "release" / "obsctl"
+)
+
+# Padding appended to small (< 1KB) and medium (< 5KB) test files for GitHub Actions
+SMALL_FILE_PADDING = ("# " + "x" * 50 + "\n") * 10
+MEDIUM_FILE_PADDING = ("# " + "x" * 100 + "\n") * 20
+
+
 class TestFileGenerator:
     """Generator-based test file management with UUID content"""
 
     def __init__(self, base_dir: str):
         self.base_dir = Path(base_dir)
         self.test_files_dir = self.base_dir / "test_files"
-        self.test_files_dir.mkdir(exist_ok=True)
+        self.test_files_dir.mkdir(parents=True, exist_ok=True)
         self.active_files = {}  # Track active test files
+        self._pool: Optional[Dict[str, Iterator[Tuple[str, str]]]] = None  # Set by prewarm
+        # One random UUID per generator - file ids swap its first 8 hex digits for a
+        # counter, so the [:8] prefixes used in object keys stay unique
+        self._uuid_tail = str(uuid.uuid4())[8:]
+        self._file_seq = itertools.count()
+        # Generated-at stamp shared by this generator's files
+        self._generated_at = time.strftime('%Y-%m-%d %H:%M:%S')
+
+    def _next_file_uuid(self) -> str:
+        """UUID-formatted id, unique among this generator's files"""
+        return f"{next(self._file_seq):08x}{self._uuid_tail}"
+
+    def prewarm(self, pool_size: int = 16, file_types: Tuple[str, ...] = ("tiny", "small", "medium")):
+        """Create pool_size files per type up front and hand those out from now on
+
+        Tests only upload their files, so pooled files are reused round-robin
+        instead of being created and deleted for every test.
+        """
+        pool_dir = self.test_files_dir / "pool"
+        pool_dir.mkdir(exist_ok=True)
+        pool = {}
+        for file_type in file_types:
+            files = []
+            for i in range(pool_size):
+                test_uuid = self._next_file_uuid()
+                file_path = pool_dir / f"pool_{file_type}_{i}_{test_uuid[:8]}.txt"
+                file_path.write_text(self._generate_file_content(test_uuid, file_type))
+                files.append((str(file_path), test_uuid))
+            pool[file_type] = itertools.cycle(files)
+        self._pool = pool
+
+    def _checkout(self, file_type: str) -> Optional[Tuple[str, str]]:
+        """Next pooled (file_path, uuid) of a type, or None if it isn't pooled"""
+        if self._pool is None or file_type not in self._pool:
+            return None
+        return next(self._pool[file_type])
 
     def generate_test_file(self, test_id: str, file_type: str = "small") -> Generator[Tuple[str, str], None, None]:
         """
         Generator that creates a test file with UUID content and yields (file_path, uuid)
         Uses generator pattern for automatic cleanup
         """
-        test_uuid = str(uuid.uuid4())
+        pooled = self._checkout(file_type)
+        if pooled is not None:
+            yield pooled
+            return
+
+        test_uuid = self._next_file_uuid()
         file_name = f"{test_id}_{file_type}_{test_uuid[:8]}.txt"
         file_path = self.test_files_dir / file_name
 
@@ -105,8 +177,7 @@ class TestFileGenerator:
 
         finally:
             # Cleanup: remove file and tracking
-            if file_path.exists():
-                file_path.unlink()
+            file_path.unlink(missing_ok=True)
             self.active_files.pop(str(file_path), None)
 
     def generate_test_file_batch(self, test_id: str, count: int = 3) -> Generator[List[Tuple[str, str]], None, None]:
@@ -114,32 +185,37 @@ class TestFileGenerator:
         Generator that creates multiple test files for batch operations
         Fan-out pattern: creates multiple files simultaneously
         """
-        files_created = []
+        batch_files = []
+        files_created = []  # Files owned by this batch - pooled files are left in place
 
         try:
             for i in range(count):
-                test_uuid = str(uuid.uuid4())
-                file_name = f"{test_id}_batch_{i}_{test_uuid[:8]}.txt"
-                file_path = self.test_files_dir / file_name
-
                 # Create varied content sizes
                 file_type = ["tiny", "small", "medium"][i % 3]
+                pooled = self._checkout(file_type)
+                if pooled is not None:
+                    batch_files.append(pooled)
+                    continue
+
+                test_uuid = self._next_file_uuid()
+                file_name = f"{test_id}_batch_{i}_{test_uuid[:8]}.txt"
+                file_path = self.test_files_dir / file_name
                 content = self._generate_file_content(test_uuid, file_type)
 
                 with open(file_path, 'w') as f:
                     f.write(content)
 
                 files_created.append((str(file_path), test_uuid))
+                batch_files.append((str(file_path), test_uuid))
                 self.active_files[str(file_path)] = test_uuid
 
             # Yield all files at once for batch testing
-            yield files_created
+            yield batch_files
 
         finally:
             # Cleanup all files
             for file_path, test_uuid in files_created:
-                if Path(file_path).exists():
-                    Path(file_path).unlink()
+                Path(file_path).unlink(missing_ok=True)
                 self.active_files.pop(file_path, None)
 
     def _generate_file_content(self, test_uuid: str, file_type: str) -> str:
@@ -147,7 +223,7 @@ class TestFileGenerator:
         base_content = f"""# Test File for obsctl Integration Testing
 # UUID: {test_uuid}
 # Type: {file_type}
-# Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}
+# Generated: {self._generated_at}
 
 This file contains a UUID for integration testing with obsctl.
 The UUID serves as a unique identifier to verify file operations.
@@ -155,16 +231,12 @@ The UUID serves as a unique identifier to verify file operations.
 UUID: {test_uuid}
 """
 
-        if file_type == "tiny":
-            return base_content
-        elif file_type == "small":
+        if file_type == "small":
             # Add some padding (still < 1KB for GitHub Actions)
-            padding = "# " + "x" * 50 + "\n"
-            return base_content + padding * 10
+            return base_content + SMALL_FILE_PADDING
         elif file_type == "medium":
             # Add more padding (still < 5KB for GitHub Actions)
-            padding = "# " + "x" * 100 + "\n"
-            return base_content + padding * 20
+            return base_content + MEDIUM_FILE_PADDING
         else:
             return base_content
 
@@ -174,7 +246,212 @@ UUID: {test_uuid}
             shutil.rmtree(self.test_files_dir, ignore_errors=True)
 
 
-def run_single_test(test_case_dict: Dict[str, Any]) -> Dict[str, Any]:
+# Lines of each generated ~/.aws file: (test case source field, source that puts
+# the value in this file, line template). A line is written when the field matches.
+CONFIG_FILE_LINES = {
+    'credentials': ('[default]', (
+        ('aws_access_key_id_source', 'credentials', 'aws_access_key_id = {access_key}'),
+        ('aws_secret_access_key_source', 'credentials', 'aws_secret_access_key = {secret_key}'),
+        ('aws_session_token_source', 'credentials', 'aws_session_token = {session_token}'),
+    )),
+    'config': ('[default]', (
+        # AWS credentials in config
+        ('aws_access_key_id_source', 'config', 'aws_access_key_id = {access_key}'),
+        ('aws_secret_access_key_source', 'config', 'aws_secret_access_key = {secret_key}'),
+        ('aws_session_token_source', 'config', 'aws_session_token = {session_token}'),
+        # AWS config values
+        ('region_source', 'config', 'region = {region}'),
+        ('endpoint_url_source', 'config', 'endpoint_url = {endpoint_url}'),
+        ('output_source', 'config', 'output = {output}'),
+        # OTEL config values
+        ('otel_enabled_source', 'config', 'otel_enabled = {otel_enabled}'),
+        ('otel_endpoint_source', 'config', 'otel_endpoint = {otel_endpoint}'),
+        ('otel_service_name_source', 'config', 'otel_service_name = {otel_service_name}'),
+    )),
+    'otel': ('[otel]', (
+        ('otel_enabled_source', 'otel', 'enabled = {otel_enabled}'),
+        ('otel_endpoint_source', 'otel', 'endpoint = {otel_endpoint}'),
+        ('otel_service_name_source', 'otel', 'service_name = {otel_service_name}'),
+    )),
+}
+
+# (file name, selected lines) -> joined file template, or None when no line is selected
+_config_file_templates: Dict[Tuple[str, Tuple[bool, ...]], Optional[str]] = {}
+
+
+def _render_config_file(test_case: ConfigTestCase, file_name: str, values: Dict[str, str]) -> Optional[str]:
+    """Render one ~/.aws file for a test case, or None if no value belongs in it"""
+    header, lines = CONFIG_FILE_LINES[file_name]
+    selected = tuple(getattr(test_case, field) == source for field, source, _ in lines)
+
+    key = (file_name, selected)
+    try:
+        template = _config_file_templates[key]
+    except KeyError:
+        if any(selected):
+            chosen = [line for (_, _, line), use in zip(lines, selected) if use]
+            template = '\n'.join([header] + chosen) + '\n'
+        else:
+            template = None
+        _config_file_templates[key] = template
+
+    return template.format(**values) if template else None
+
+
+def _otel_enabled_text(value: Optional[bool]) -> str:
+    """Config file spelling of an otel enabled value"""
+    return str(value).lower() if value is not None else 'true'
+
+
+def _write_file(path: bytes, content: str):
+    """Write a small file with raw os calls - no io buffering layer for a single write"""
+    data = content.encode()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+# AWS/OTEL variables that must not leak from the caller's environment into a test
+AWS_ENV_VARS = frozenset([
+    'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN',
+    'AWS_DEFAULT_REGION', 'AWS_ENDPOINT_URL', 'AWS_PROFILE',
+    'OTEL_ENABLED', 'OTEL_EXPORTER_OTLP_ENDPOINT', 'OTEL_SERVICE_NAME'
+])
+
+# Caller's environment without AWS_ENV_VARS, built once per process
+BASE_TEST_ENV = {key: value for key, value in os.environ.items() if key not in AWS_ENV_VARS}
+
+# obsctl debug output lines reporting the OTEL endpoint and service name in use
+OTEL_DEBUG_RE = re.compile(r'gRPC endpoint: (\S+)|Service: (\S+)')
+
+# Directory holding every test environment of a run and the run's id, set in each
+# worker by _init_test_worker. Without them, environments fall back to their own
+# mkdtemp directory and a bucket per test.
+_test_root: Optional[str] = None
+_run_id: Optional[str] = None
+# Per-worker state - thread-local so thread and process pool workers both get their own:
+#   bucket: name of the worker's shared bucket, once created
+#   file_generator: prewarmed test files, shared by every environment the worker runs
+_worker = threading.local()
+# Record a worker leaves in its bucket-owner-* directory under the run root, so the
+# parent can remove the bucket even if the worker died without cleaning up
+BUCKET_RECORD = "bucket.json"
+
+
+def _worker_id() -> str:
+    """Name of the current worker - unique across the processes and threads of a run"""
+    return f"{os.getpid()}-{threading.get_native_id()}"
+
+
+def _init_test_worker(test_root: str, run_id: str):
+    """Worker initializer - point test environments at the run's shared root"""
+    global _test_root, _run_id
+    _test_root = test_root
+    _run_id = run_id
+    _worker.file_generator = TestFileGenerator(os.path.join(test_root, f"files-{_worker_id()}"))
+    _worker.file_generator.prewarm()
+
+
+def run_obsctl_command(cmd_args: List[str], test_env: Dict[str, str], timeout: int = 30) -> Dict[str, Any]:
+    """Run a single obsctl command"""
+    try:
+        cmd = [OBSCTL_BINARY, '--debug', 'debug'] + cmd_args
+
+        # Capture raw bytes and decode once below - no TextIOWrapper per stream,
+        # and invalid UTF-8 in obsctl output can't fail the command
+        result = subprocess.run(
+            cmd,
+            env=test_env,
+            capture_output=True,
+            timeout=timeout
+        )
+
+        return {
+            'stdout': result.stdout.decode('utf-8', 'replace'),
+            'stderr': result.stderr.decode('utf-8', 'replace'),
+            'returncode': result.returncode,
+            'command': ' '.join(cmd)
+        }
+    except subprocess.TimeoutExpired:
+        return {
+            'stdout': '',
+            'stderr': f'Command timed out after {timeout} seconds',
+            'returncode': -1,
+            'command': ' '.join(cmd)
+        }
+    except Exception as e:
+        return {
+            'stdout': '',
+            'stderr': f'Command execution failed: {str(e)}',
+            'returncode': -2,
+            'command': ' '.join(cmd)
+        }
+
+
+def _ensure_worker_bucket(test_env: Dict[str, str], aws_dir: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Bucket shared by the tests of this worker, created on first use
+
+    Returns (bucket_name, mb_result) - mb_result is None when the bucket already
+    existed. The creating test's ~/.aws and env overrides are recorded in the run
+    root before the bucket is made, because the parent removes the bucket with
+    them at the end of the run (_remove_run_buckets), long after that test cleaned up.
+    """
+    bucket_name = getattr(_worker, 'bucket', None)
+    if bucket_name is not None:
+        return bucket_name, None
+
+    bucket_name = f"obsctl-test-{_run_id}-{_worker_id()}"
+    owner_home = os.path.join(_test_root, f"bucket-owner-{_worker_id()}")
+    shutil.copytree(aws_dir, os.path.join(owner_home, ".aws"))
+    env_overrides = {
+        key: value for key, value in test_env.items()
+        if key != 'HOME' and BASE_TEST_ENV.get(key) != value
+    }
+    _write_file(os.fsencode(os.path.join(owner_home, BUCKET_RECORD)),
+                json.dumps({'bucket': bucket_name, 'env': env_overrides}))
+
+    mb_result = run_obsctl_command(['mb', f's3://{bucket_name}'], test_env)
+    if mb_result['returncode'] == 0:
+        _worker.bucket = bucket_name
+    else:
+        # Nothing to remove later - the next test of this worker tries again
+        shutil.rmtree(owner_home, ignore_errors=True)
+    return bucket_name, mb_result
+
+
+def _remove_run_buckets(test_root: str):
+    """Remove every shared bucket recorded under a run root, with the objects in it
+
+    Runs in the parent after the pool has stopped, so buckets of workers that
+    crashed or were terminated are removed too.
+    """
+    with os.scandir(test_root) as it:
+        owner_homes = [entry.path for entry in it if entry.name.startswith("bucket-owner-")]
+    for owner_home in owner_homes:
+        try:
+            with open(os.path.join(owner_home, BUCKET_RECORD)) as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            continue
+        owner_env = dict(BASE_TEST_ENV, **record['env'], HOME=owner_home)
+        run_obsctl_command(['rb', f"s3://{record['bucket']}", '--force'], owner_env)
+
+
+def _remove_tree(path: str):
+    """Remove a directory tree using the entry types from os.scandir - no per-entry stat"""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def run_single_test(test_case_dict: Dict[str, Any]) -> TestResult:
     """Run a single test in isolated environment - standalone function for pickling"""
     # Reconstruct test case from dict
     test_case = ConfigTestCase(**test_case_dict)
@@ -186,27 +463,24 @@ def run_single_test(test_case_dict: Dict[str, Any]) -> Dict[str, Any]:
         result = test_env.execute_obsctl_test()
         verification = test_env.verify_expectations(test_case, result)
 
-        return {
-            'test_id': test_case.test_id,
-            'category': test_case.category,
-            'description': test_case.description,
-            'status': 'PASS' if verification['success'] else 'FAIL',
-            'result': result,
-            'verification': verification,
-            'execution_time': test_env.execution_time,
-            'test_case': asdict(test_case),
-            'files_tested': getattr(test_env, 'files_tested', [])
-        }
+        return TestResult(
+            test_id=test_case.test_id,
+            category=test_case.category,
+            status='PASS' if verification['success'] else 'FAIL',
+            execution_time=test_env.execution_time,
+            failures=tuple(verification['failures']),
+            otel_enabled=verification['otel_enabled'],
+            description=test_case.description
+        )
     except Exception as e:
-        return {
-            'test_id': test_case.test_id,
-            'category': test_case.category,
-            'description': test_case.description,
-            'status': 'ERROR',
-            'error': str(e),
-            'execution_time': getattr(test_env, 'execution_time', 0),
-            'test_case': asdict(test_case)
-        }
+        return TestResult(
+            test_id=test_case.test_id,
+            category=test_case.category,
+            status='ERROR',
+            execution_time=getattr(test_env, 'execution_time', 0),
+            description=test_case.description,
+            error=str(e)
+        )
     finally:
         test_env.cleanup()
 
@@ -216,11 +490,20 @@ class IsolatedTestEnvironment:
 
     def __init__(self, test_id: str):
         self.test_id = test_id
-        self.temp_dir = tempfile.mkdtemp(prefix=f"obsctl-test-{test_id}-")
+        if _test_root is not None:
+            # Test ids are unique within a run
+            self.temp_dir = os.path.join(_test_root, test_id)
+            os.mkdir(self.temp_dir)
+        else:
+            self.temp_dir = tempfile.mkdtemp(prefix=f"obsctl-test-{test_id}-")
         self.aws_dir = os.path.join(self.temp_dir, ".aws")
+        # Paths of the generated files, as bytes for os.open
+        self._cred_path = os.fsencode(os.path.join(self.aws_dir, "credentials"))
+        self._config_path = os.fsencode(os.path.join(self.aws_dir, "config"))
+        self._otel_path = os.fsencode(os.path.join(self.aws_dir, "otel"))
         self.execution_time = 0
         self.original_env = {}
-        self.file_generator = TestFileGenerator(self.temp_dir)
+        self.file_generator = getattr(_worker, 'file_generator', None) or TestFileGenerator(self.temp_dir)
         self.files_tested = []
 
     def setup(self, test_case: ConfigTestCase):
@@ -234,128 +517,47 @@ class IsolatedTestEnvironment:
 
     def _create_credentials_file(self, test_case: ConfigTestCase):
         """Create ~/.aws/credentials file"""
-        credentials_content = []
-
-        # Default profile
-        if (test_case.aws_access_key_id_source == 'credentials' or
-            test_case.aws_secret_access_key_source == 'credentials' or
-            test_case.aws_session_token_source == 'credentials'):
-
-            credentials_content.append("[default]")
-
-            if test_case.aws_access_key_id_source == 'credentials':
-                credentials_content.append(f"aws_access_key_id = {test_case.aws_access_key_id_value or 'AKIATEST12345'}")
-
-            if test_case.aws_secret_access_key_source == 'credentials':
-                credentials_content.append(f"aws_secret_access_key = {test_case.aws_secret_access_key_value or 'testsecretkey12345'}")
-
-            if test_case.aws_session_token_source == 'credentials':
-                credentials_content.append(f"aws_session_token = {test_case.aws_session_token_value or 'testsessiontoken12345'}")
-
-        if credentials_content:
-            with open(os.path.join(self.aws_dir, "credentials"), 'w') as f:
-                f.write('\n'.join(credentials_content) + '\n')
+        content = _render_config_file(test_case, 'credentials', {
+            'access_key': test_case.aws_access_key_id_value or 'AKIATEST12345',
+            'secret_key': test_case.aws_secret_access_key_value or 'testsecretkey12345',
+            'session_token': test_case.aws_session_token_value or 'testsessiontoken12345',
+        })
+        if content:
+            _write_file(self._cred_path, content)
 
     def _create_config_file(self, test_case: ConfigTestCase):
         """Create ~/.aws/config file"""
-        config_content = []
-
-        # Check if any config values should be in config file
-        has_config_values = any([
-            test_case.aws_access_key_id_source == 'config',
-            test_case.aws_secret_access_key_source == 'config',
-            test_case.aws_session_token_source == 'config',
-            test_case.region_source == 'config',
-            test_case.endpoint_url_source == 'config',
-            test_case.output_source == 'config',
-            test_case.otel_enabled_source == 'config',
-            test_case.otel_endpoint_source == 'config',
-            test_case.otel_service_name_source == 'config'
-        ])
-
-        if has_config_values:
-            config_content.append("[default]")
-
-            # AWS credentials in config
-            if test_case.aws_access_key_id_source == 'config':
-                config_content.append(f"aws_access_key_id = {test_case.aws_access_key_id_value or 'AKIACONFIG12345'}")
-
-            if test_case.aws_secret_access_key_source == 'config':
-                config_content.append(f"aws_secret_access_key = {test_case.aws_secret_access_key_value or 'configsecretkey12345'}")
-
-            if test_case.aws_session_token_source == 'config':
-                config_content.append(f"aws_session_token = {test_case.aws_session_token_value or 'configsessiontoken12345'}")
-
-            # AWS config values
-            if test_case.region_source == 'config':
-                config_content.append(f"region = {test_case.region_value or 'us-west-2'}")
-
-            if test_case.endpoint_url_source == 'config':
-                config_content.append(f"endpoint_url = {test_case.endpoint_url_value or 'http://localhost:9000'}")
-
-            if test_case.output_source == 'config':
-                config_content.append(f"output = {test_case.output_value or 'json'}")
-
-            # OTEL config values
-            if test_case.otel_enabled_source == 'config':
-                enabled_val = str(test_case.otel_enabled_value).lower() if test_case.otel_enabled_value is not None else 'true'
-                config_content.append(f"otel_enabled = {enabled_val}")
-
-            if test_case.otel_endpoint_source == 'config':
-                config_content.append(f"otel_endpoint = {test_case.otel_endpoint_value or 'http://localhost:4317'}")
-
-            if test_case.otel_service_name_source == 'config':
-                config_content.append(f"otel_service_name = {test_case.otel_service_name_value or 'obsctl-config'}")
-
-        if config_content:
-            with open(os.path.join(self.aws_dir, "config"), 'w') as f:
-                f.write('\n'.join(config_content) + '\n')
+        content = _render_config_file(test_case, 'config', {
+            'access_key': test_case.aws_access_key_id_value or 'AKIACONFIG12345',
+            'secret_key': test_case.aws_secret_access_key_value or 'configsecretkey12345',
+            'session_token': test_case.aws_session_token_value or 'configsessiontoken12345',
+            'region': test_case.region_value or 'us-west-2',
+            'endpoint_url': test_case.endpoint_url_value or 'http://localhost:9000',
+            'output': test_case.output_value or 'json',
+            'otel_enabled': _otel_enabled_text(test_case.otel_enabled_value),
+            'otel_endpoint': test_case.otel_endpoint_value or 'http://localhost:4317',
+            'otel_service_name': test_case.otel_service_name_value or 'obsctl-config',
+        })
+        if content:
+            _write_file(self._config_path, content)
 
     def _create_otel_file(self, test_case: ConfigTestCase):
         """Create ~/.aws/otel file"""
-        otel_content = []
-
-        # Check if any OTEL values should be in otel file
-        has_otel_values = any([
-            test_case.otel_enabled_source == 'otel',
-            test_case.otel_endpoint_source == 'otel',
-            test_case.otel_service_name_source == 'otel'
-        ])
-
-        if has_otel_values:
-            otel_content.append("[otel]")
-
-            if test_case.otel_enabled_source == 'otel':
-                enabled_val = str(test_case.otel_enabled_value).lower() if test_case.otel_enabled_value is not None else 'true'
-                otel_content.append(f"enabled = {enabled_val}")
-
-            if test_case.otel_endpoint_source == 'otel':
-                otel_content.append(f"endpoint = {test_case.otel_endpoint_value or 'http://localhost:4318'}")
-
-            if test_case.otel_service_name_source == 'otel':
-                otel_content.append(f"service_name = {test_case.otel_service_name_value or 'obsctl-otel'}")
-
-        if otel_content:
-            with open(os.path.join(self.aws_dir, "otel"), 'w') as f:
-                f.write('\n'.join(otel_content) + '\n')
+        content = _render_config_file(test_case, 'otel', {
+            'otel_enabled': _otel_enabled_text(test_case.otel_enabled_value),
+            'otel_endpoint': test_case.otel_endpoint_value or 'http://localhost:4318',
+            'otel_service_name': test_case.otel_service_name_value or 'obsctl-otel',
+        })
+        if content:
+            _write_file(self._otel_path, content)
 
     def execute_obsctl_test(self) -> Dict[str, Any]:
         """Execute obsctl command with MinIO integration testing"""
         start_time = time.time()
 
         try:
-            # Build environment for this test
-            test_env = os.environ.copy()
-
-            # Clear AWS-related environment variables first
-            aws_env_vars = [
-                'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN',
-                'AWS_DEFAULT_REGION', 'AWS_ENDPOINT_URL', 'AWS_PROFILE',
-                'OTEL_ENABLED', 'OTEL_EXPORTER_OTLP_ENDPOINT', 'OTEL_SERVICE_NAME'
-            ]
-
-            for var in aws_env_vars:
-                test_env.pop(var, None)
+            # Build environment for this test from the already scrubbed base
+            test_env = BASE_TEST_ENV.copy()
 
             # Set HOME to our temp directory
             test_env['HOME'] = self.temp_dir
@@ -390,51 +592,27 @@ class IsolatedTestEnvironment:
 
     def _run_obsctl_command(self, cmd_args: List[str], test_env: Dict[str, str], timeout: int = 30) -> Dict[str, Any]:
         """Run a single obsctl command"""
-        try:
-            cmd = ['./target/release/obsctl', '--debug', 'debug'] + cmd_args
-
-            result = subprocess.run(
-                cmd,
-                env=test_env,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd='/Users/casibbald/Workspace/microscaler/obsctl'
-            )
-
-            return {
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'returncode': result.returncode,
-                'command': ' '.join(cmd)
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                'stdout': '',
-                'stderr': f'Command timed out after {timeout} seconds',
-                'returncode': -1,
-                'command': ' '.join(cmd)
-            }
-        except Exception as e:
-            return {
-                'stdout': '',
-                'stderr': f'Command execution failed: {str(e)}',
-                'returncode': -2,
-                'command': ' '.join(cmd)
-            }
+        return run_obsctl_command(cmd_args, test_env, timeout)
 
     def _test_file_operations(self, test_env: Dict[str, str]) -> Dict[str, Any]:
         """Test file operations using UUID-based test files"""
         operations_results = {}
 
         try:
-            # Create test bucket
-            bucket_name = f"test-{self.test_id.lower().replace('_', '-')}"
-            mb_result = self._run_obsctl_command(['mb', f's3://{bucket_name}'], test_env)
-            operations_results['mb'] = mb_result
+            if _run_id is not None:
+                # Share the worker's bucket - objects are kept apart by a test id prefix
+                bucket_name, mb_result = _ensure_worker_bucket(test_env, self.aws_dir)
+                key_prefix = f"{self.test_id}/"
+            else:
+                # Create test bucket
+                bucket_name = f"test-{self.test_id.lower().replace('_', '-')}"
+                mb_result = self._run_obsctl_command(['mb', f's3://{bucket_name}'], test_env)
+                key_prefix = ""
 
-            if mb_result['returncode'] != 0:
-                return operations_results
+            if mb_result is not None:
+                operations_results['mb'] = mb_result
+                if mb_result['returncode'] != 0:
+                    return operations_results
 
             # Test single file upload using generator
             for file_path, test_uuid in self.file_generator.generate_test_file(self.test_id, "small"):
@@ -442,14 +620,14 @@ class IsolatedTestEnvironment:
 
                 # Upload file
                 cp_result = self._run_obsctl_command([
-                    'cp', file_path, f's3://{bucket_name}/single-{test_uuid[:8]}.txt'
+                    'cp', file_path, f's3://{bucket_name}/{key_prefix}single-{test_uuid[:8]}.txt'
                 ], test_env)
                 operations_results['cp_single'] = cp_result
 
                 if cp_result['returncode'] == 0:
                     # Verify file exists
                     ls_result = self._run_obsctl_command([
-                        'ls', f's3://{bucket_name}/single-{test_uuid[:8]}.txt'
+                        'ls', f's3://{bucket_name}/{key_prefix}single-{test_uuid[:8]}.txt'
                     ], test_env)
                     operations_results['ls_verify'] = ls_result
 
@@ -462,15 +640,16 @@ class IsolatedTestEnvironment:
 
                     # Upload each file in batch
                     cp_result = self._run_obsctl_command([
-                        'cp', file_path, f's3://{bucket_name}/batch-{test_uuid[:8]}.txt'
+                        'cp', file_path, f's3://{bucket_name}/{key_prefix}batch-{test_uuid[:8]}.txt'
                     ], test_env)
                     batch_results.append(cp_result)
 
                 operations_results['cp_batch'] = batch_results
 
-            # Clean up test bucket
-            rb_result = self._run_obsctl_command(['rb', f's3://{bucket_name}', '--force'], test_env)
-            operations_results['rb'] = rb_result
+            # Clean up test bucket - a shared worker bucket is removed when the worker exits
+            if _run_id is None:
+                rb_result = self._run_obsctl_command(['rb', f's3://{bucket_name}', '--force'], test_env)
+                operations_results['rb'] = rb_result
 
         except Exception as e:
             operations_results['error'] = str(e)
@@ -511,19 +690,15 @@ class IsolatedTestEnvironment:
                 f"OTEL enabled mismatch: expected {test_case.expected_otel_enabled}, got {verification['otel_enabled']}"
             )
 
-        # Extract endpoint from debug output
-        if 'gRPC endpoint:' in output:
-            import re
-            endpoint_match = re.search(r'gRPC endpoint: (\S+)', output)
-            if endpoint_match:
-                verification['endpoint_used'] = endpoint_match.group(1)
-
-        # Extract service name from debug output
-        if 'Service:' in output:
-            import re
-            service_match = re.search(r'Service: (\S+)', output)
-            if service_match:
-                verification['service_name_used'] = service_match.group(1).split()[0]  # Take just the service name
+        # Extract endpoint and service name from debug output in one scan - first match of each wins
+        for match in OTEL_DEBUG_RE.finditer(output):
+            endpoint, service_name = match.groups()
+            if endpoint and verification['endpoint_used'] is None:
+                verification['endpoint_used'] = endpoint
+            elif service_name and verification['service_name_used'] is None:
+                verification['service_name_used'] = service_name
+            if verification['endpoint_used'] and verification['service_name_used']:
+                break
 
         # Verify endpoint expectation
         if test_case.expected_endpoint and verification['endpoint_used']:
@@ -552,65 +727,160 @@ class IsolatedTestEnvironment:
 
     def cleanup(self):
         """Clean up test environment"""
-        # Clean up file generator
-        self.file_generator.cleanup_all()
-
-        # Remove temporary directory
-        if os.path.exists(self.temp_dir):
+        # Remove temporary directory - the file generator's test files live inside it
+        try:
+            _remove_tree(self.temp_dir)
+        except FileNotFoundError:
+            pass
+        except OSError:
             shutil.rmtree(self.temp_dir, ignore_errors=True)
 
 
 class ParallelConfigTestFramework:
-    """Framework for running configuration tests in parallel using ThreadPoolExecutor"""
-
-    def __init__(self, max_workers: Optional[int] = None):
-        self.max_workers = max_workers or min(os.cpu_count() or 4, 8)  # Cap at 8 for stability
-
-    async def run_test_batch(self, test_cases: List[ConfigTestCase]) -> List[Dict[str, Any]]:
-        """Run a batch of tests in parallel using threads"""
-        loop = asyncio.get_event_loop()
-
-        # Convert test cases to dicts for easier handling
-        test_case_dicts = [asdict(test_case) for test_case in test_cases]
+    """Framework for running configuration tests in parallel on a thread or process pool
+
+    Tests spend nearly all their time waiting on obsctl subprocesses, so the
+    default thread pool gives the same concurrency without an interpreter
+    (~20MB RSS) per worker. executor='process' runs each worker in its own process.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, executor: str = 'thread'):
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"Unknown executor: {executor}")
+        self.executor_kind = executor
+        if executor == 'thread':
+            # ThreadPoolExecutor's own default - I/O-bound, but capped at 32 concurrent obsctl runs
+            self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        else:
+            self.max_workers = max_workers or os.cpu_count() or 4
+        self._executor: Optional[Executor] = None
+        self._test_root: Optional[str] = None
+
+    def _get_executor(self) -> Executor:
+        """Worker pool shared by all batches, started on first use"""
+        if self._executor is None:
+            # One directory for the whole run - each test only adds its own subdirectory
+            self._test_root = tempfile.mkdtemp(prefix="obsctl-release-tests-")
+            initargs = (self._test_root, uuid.uuid4().hex[:8])
+            if self.executor_kind == 'thread':
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="release-test",
+                    initializer=_init_test_worker,
+                    initargs=initargs
+                )
+            else:
+                # forkserver workers start from a clean server process instead of
+                # re-importing everything (spawn) or inheriting the parent's threads (fork)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                    initializer=_init_test_worker,
+                    initargs=initargs
+                )
+        return self._executor
 
-        # Use ThreadPoolExecutor instead of ProcessPoolExecutor
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tests
-            futures = []
-            for test_case_dict in test_case_dicts:
-                future = loop.run_in_executor(executor, run_single_test, test_case_dict)
-                futures.append(future)
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool
 
-            # Wait for all tests to complete
-            results = await asyncio.gather(*futures, return_exceptions=True)
+        With wait=False, process workers are killed instead of awaited - their
+        buckets are still removed, from the records in the run root. Threads
+        can't be killed, so a thread pool still lets its running tests finish.
+        """
+        if self._executor is not None:
+            if not wait and isinstance(self._executor, ProcessPoolExecutor):
+                self._terminate_workers(self._executor)
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._test_root is not None:
+            # Workers are gone, however they exited - remove their buckets before the
+            # ~/.aws copies they need are deleted with the root
+            _remove_run_buckets(self._test_root)
+            shutil.rmtree(self._test_root, ignore_errors=True)
+            self._test_root = None
+
+    @staticmethod
+    def _terminate_workers(executor: ProcessPoolExecutor):
+        """Kill the pool's worker processes, if this Python offers a way to reach them"""
+        terminate_workers = getattr(executor, "terminate_workers", None)
+        if terminate_workers is not None:  # Python 3.14+
+            terminate_workers()
+            return
+
+        # Older pools (the 3.11 CI interpreter included) have no public API for this -
+        # use the private pid -> Process table only while it still has that shape,
+        # otherwise fall back to waiting for the running tests
+        processes = getattr(executor, "_processes", None)
+        if not isinstance(processes, dict):
+            return
+        for process in list(processes.values()):
+            if isinstance(process, multiprocessing.process.BaseProcess):
+                process.terminate()
+
+    def run_test_batch(self, test_cases: List[ConfigTestCase]) -> Iterator[TestResult]:
+        """Run a batch of tests in parallel, yielding results as they complete"""
+        # Convert test cases to dicts for pickling to the workers - every field is a
+        # plain value, so a shallow copy of the instance dict matches asdict()
+        executor = self._get_executor()
+        futures = {
+            executor.submit(run_single_test, dict(vars(test_case))): test_case
+            for test_case in test_cases
+        }
 
         # Convert exceptions to error results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append({
-                    'test_id': test_cases[i].test_id,
-                    'category': test_cases[i].category,
-                    'status': 'ERROR',
-                    'error': str(result),
-                    'execution_time': 0
-                })
-            else:
-                processed_results.append(result)
-
-        return processed_results
-
+        for future in as_completed(futures):
+            error = future.exception()
+            yield _error_result(futures[future], error) if error else future.result()
+
+    def run_stream(self, test_cases: Iterator[ConfigTestCase], max_in_flight: Optional[int] = None,
+                   deadline: Optional[float] = None) -> Iterator[TestResult]:
+        """Run test cases from an iterator, yielding each result as soon as it completes
+
+        At most max_in_flight tests (default: twice the worker count, so no worker
+        waits for its next test) are submitted at once. A new test case is only
+        pulled from the iterator when a running one finishes. Raises TimeoutError
+        if the time.monotonic() deadline passes while tests are still running.
+        """
+        executor = self._get_executor()
+        max_in_flight = max_in_flight or self.max_workers * 2
+        pending: Dict[Future, ConfigTestCase] = {}
+
+        def submit(test_case: ConfigTestCase):
+            future = executor.submit(run_single_test, dict(vars(test_case)))
+            pending[future] = test_case
+
+        for test_case in itertools.islice(test_cases, max_in_flight):
+            submit(test_case)
+
+        while pending:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                raise TimeoutError("test run exceeded its deadline")
+            for future in done:
+                test_case = pending.pop(future)
+                error = future.exception()
+                yield _error_result(test_case, error) if error else future.result()
+
+            # Refill the freed slots
+            for test_case in itertools.islice(test_cases, max_in_flight - len(pending)):
+                submit(test_case)
+
+
+def _error_result(test_case: ConfigTestCase, error: BaseException) -> TestResult:
+    """Result entry for a test whose worker raised instead of returning"""
+    return TestResult(
+        test_id=test_case.test_id,
+        category=test_case.category,
+        status='ERROR',
+        execution_time=0,
+        description=test_case.description,
+        error=str(error)
+    )
 
-def generate_test_matrix() -> Dict[str, List[ConfigTestCase]]:
-    """Generate test matrix organized by category"""
-    test_matrix = {
-        'credentials': [],
-        'config': [],
-        'otel': [],
-        'mixed': []
-    }
 
-    # Category A: AWS Credentials Tests (simplified subset for now)
+def _iter_credentials_tests() -> Iterator[ConfigTestCase]:
+    """Category A: AWS Credentials Tests (simplified subset for now)"""
     test_id = 0
     for access_key_source in ['credentials', 'config', 'env', 'missing']:
         for secret_key_source in ['credentials', 'config', 'env', 'missing']:
@@ -618,7 +888,7 @@ def generate_test_matrix() -> Dict[str, List[ConfigTestCase]]:
             if test_id >= 16:  # Limit to first 16 for initial testing
                 break
 
-            test_matrix['credentials'].append(ConfigTestCase(
+            yield ConfigTestCase(
                 test_id=f"cred_{test_id:04d}",
                 category='credentials',
                 description=f"Credentials: access_key from {access_key_source}, secret_key from {secret_key_source}",
@@ -653,10 +923,12 @@ def generate_test_matrix() -> Dict[str, List[ConfigTestCase]]:
                 expected_endpoint=None,
                 expected_service_name='obsctl',
                 expected_region='us-east-1'
-            ))
+            )
             test_id += 1
 
-    # Category C: OTEL Config Tests (simplified subset)
+
+def _iter_otel_tests() -> Iterator[ConfigTestCase]:
+    """Category C: OTEL Config Tests (simplified subset)"""
     test_id = 0
     for otel_enabled_source in ['otel', 'config', 'env', 'missing']:
         for otel_endpoint_source in ['otel', 'config', 'env', 'missing']:
@@ -667,7 +939,7 @@ def generate_test_matrix() -> Dict[str, List[ConfigTestCase]]:
             expected_enabled = _determine_otel_enabled(otel_enabled_source, otel_endpoint_source)
             expected_endpoint = _determine_expected_endpoint(otel_endpoint_source)
 
-            test_matrix['otel'].append(ConfigTestCase(
+            yield ConfigTestCase(
                 test_id=f"otel_{test_id:04d}",
                 category='otel',
                 description=f"OTEL: enabled from {otel_enabled_source}, endpoint from {otel_endpoint_source}",
@@ -702,18 +974,39 @@ def generate_test_matrix() -> Dict[str, List[ConfigTestCase]]:
                 expected_endpoint=expected_endpoint,
                 expected_service_name='obsctl',
                 expected_region='us-east-1'
-            ))
+            )
             test_id += 1
 
-    return test_matrix
 
+# Test case generators per category - config and mixed have no cases yet
+TEST_CATEGORIES: Dict[str, Optional[Callable[[], Iterator[ConfigTestCase]]]] = {
+    'credentials': _iter_credentials_tests,
+    'config': None,
+    'otel': _iter_otel_tests,
+    'mixed': None,
+}
+
+
+def iter_test_matrix(category: str = 'all') -> Iterator[ConfigTestCase]:
+    """Yield the test cases of one category, or of all categories in order"""
+    for cat_name, generator in TEST_CATEGORIES.items():
+        if generator is not None and category in ('all', cat_name):
+            yield from generator()
 
+
+def generate_test_matrix() -> Dict[str, List[ConfigTestCase]]:
+    """Generate test matrix organized by category"""
+    return {cat_name: list(iter_test_matrix(cat_name)) for cat_name in TEST_CATEGORIES}
+
+
+@functools.lru_cache(maxsize=None)
 def _determine_aws_works(access_key_source: str, secret_key_source: str) -> bool:
     """Determine if AWS should work based on credential sources"""
     # AWS works if both access key and secret key are available (not missing)
     return access_key_source != 'missing' and secret_key_source != 'missing'
 
 
+@functools.lru_cache(maxsize=None)
 def _determine_otel_enabled(enabled_source: str, endpoint_source: str) -> bool:
     """Determine if OTEL should be enabled"""
     # OTEL is enabled if explicitly enabled OR if endpoint is provided (auto-enable)
@@ -724,6 +1017,7 @@ def _determine_otel_enabled(enabled_source: str, endpoint_source: str) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=None)
 def _determine_expected_endpoint(endpoint_source: str) -> Optional[str]:
     """Determine expected OTEL endpoint"""
     if endpoint_source == 'otel':
@@ -735,77 +1029,126 @@ def _determine_expected_endpoint(endpoint_source: str) -> Optional[str]:
     return None
 
 
-async def run_release_config_tests(category: str = 'all', max_workers: Optional[int] = None) -> Dict[str, Any]:
-    """Main entry point for release configuration tests"""
-    print("🚀 Starting Release Configuration Tests")
-    print(f"📊 Parallel execution with {max_workers or os.cpu_count()} workers")
+def run_release_config_tests(category: str = 'all', max_workers: Optional[int] = None,
+                             timeout: Optional[float] = None, executor: str = 'thread') -> Dict[str, List[TestResult]]:
+    """Main entry point for release configuration tests - raises TimeoutError after timeout seconds"""
+    framework = ParallelConfigTestFramework(max_workers, executor)
 
-    # Generate test matrix
-    test_matrix = generate_test_matrix()
+    print("🚀 Starting Release Configuration Tests")
+    print(f"📊 Parallel execution with {framework.max_workers} {executor} workers")
 
     # Filter by category if specified
-    if category != 'all':
-        if category in test_matrix:
-            test_matrix = {category: test_matrix[category]}
-        else:
-            print(f"❌ Unknown category: {category}")
-            return {}
-
-    total_tests = sum(len(tests) for tests in test_matrix.values())
+    if category == 'all':
+        categories = list(TEST_CATEGORIES)
+    elif category in TEST_CATEGORIES:
+        categories = [category]
+    else:
+        print(f"❌ Unknown category: {category}")
+        return {}
+
+    # Test cases are generated on demand - count them without keeping them
+    category_sizes = {cat_name: sum(1 for _ in iter_test_matrix(cat_name)) for cat_name in categories}
+    total_tests = sum(category_sizes.values())
     print(f"📋 Total tests: {total_tests}")
 
-    framework = ParallelConfigTestFramework(max_workers)
     all_results = {}
+    status_counts: Dict[str, Counter] = {}  # Running status tally per category
 
     # Run each category
     start_time = time.time()
+    deadline = time.monotonic() + timeout if timeout is not None else None
 
-    for cat_name, test_cases in test_matrix.items():
-        if not test_cases:
-            continue
-
-        print(f"🔄 Running {cat_name} tests ({len(test_cases)} tests)")
-        category_start = time.time()
+    # Progress lines are buffered per category and written out once it completes
+    category_logs: Dict[str, List[str]] = {}
 
-        # Split into batches for better memory management
-        batch_size = 4  # Smaller batches for stability
-        batches = [test_cases[i:i+batch_size] for i in range(0, len(test_cases), batch_size)]
+    def flush_log(lines: List[str]):
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
+            lines.clear()
 
-        category_results = []
-        for i, batch in enumerate(batches):
-            print(f"  📦 Batch {i+1}/{len(batches)} ({len(batch)} tests)")
-            batch_results = await framework.run_test_batch(batch)
-            category_results.extend(batch_results)
-
-        all_results[cat_name] = category_results
-        category_time = time.time() - category_start
-
-        # Show category summary
-        passed = len([r for r in category_results if r['status'] == 'PASS'])
-        failed = len([r for r in category_results if r['status'] == 'FAIL'])
-        errors = len([r for r in category_results if r['status'] == 'ERROR'])
-
-        print(f"✅ {cat_name} completed in {category_time:.2f}s: {passed} passed, {failed} failed, {errors} errors")
+    completed = False
+    try:
+        # Stream every category through one window, so the next category's tests
+        # start while the previous one's last tests are still running
+        running = [cat_name for cat_name in categories if category_sizes[cat_name]]
+        flush_log([f"🔄 Running {cat_name} tests ({category_sizes[cat_name]} tests)" for cat_name in running])
+        for cat_name in running:
+            # Sized up front - each result is stored at its test case's matrix position
+            all_results[cat_name] = [None] * category_sizes[cat_name]
+            status_counts[cat_name] = Counter()
+            category_logs[cat_name] = []
+
+        progress_every = 4
+
+        # Matrix position of each submitted test case, until its result arrives
+        positions: Dict[str, int] = {}
+
+        def indexed_tests(cat_name: str) -> Iterator[ConfigTestCase]:
+            for position, test_case in enumerate(iter_test_matrix(cat_name)):
+                positions[test_case.test_id] = position
+                yield test_case
+
+        test_cases = itertools.chain.from_iterable(indexed_tests(cat_name) for cat_name in running)
+        for result in framework.run_stream(test_cases, deadline=deadline):
+            # Results unpickled from process workers carry fresh strings - intern the
+            # status so the == 'PASS' checks and Counter lookups below hit the identity fast path
+            result.status = sys.intern(result.status)
+            cat_name = result.category
+            category_size = category_sizes[cat_name]
+            all_results[cat_name][positions.pop(result.test_id)] = result
+            counts = status_counts[cat_name]
+            counts[result.status] += 1
+            completed_count = counts.total()
+            if completed_count % progress_every == 0 or completed_count == category_size:
+                category_logs[cat_name].append(f"  📦 {cat_name}: completed {completed_count}/{category_size} tests")
+
+            if completed_count == category_size:
+                # Categories overlap, so their time is measured from the start of the run
+                category_time = time.time() - start_time
+
+                # Show category summary
+                category_logs[cat_name].append(
+                    f"✅ {cat_name} completed in {category_time:.2f}s: {counts['PASS']} passed, "
+                    f"{counts['FAIL']} failed, {counts['ERROR']} errors"
+                )
+                flush_log(category_logs[cat_name])
+        completed = True
+    finally:
+        # Keep the progress of categories cut short by a timeout or interrupt
+        for lines in category_logs.values():
+            flush_log(lines)
+        # On timeout or interrupt, don't wait for the tests still running
+        framework.shutdown(wait=completed)
 
     total_time = time.time() - start_time
 
     # Generate comprehensive report
-    generate_release_test_report(all_results, total_time)
+    generate_release_test_report(all_results, total_time, status_counts)
 
     return all_results
 
 
-def generate_release_test_report(results: Dict[str, List[Dict[str, Any]]], total_time: float):
-    """Generate comprehensive test report for release"""
-    total_tests = sum(len(category_results) for category_results in results.values())
-    passed_tests = sum(
-        len([r for r in category_results if r['status'] == 'PASS'])
-        for category_results in results.values()
-    )
-    failed_tests = sum(
-        len([r for r in category_results if r['status'] == 'FAIL'])
-        for category_results in results.values()
-    )
+def generate_release_test_report(results: Dict[str, List[TestResult]], total_time: float,
+                                 status_counts: Optional[Dict[str, Counter]] = None):
+    """Generate comprehensive test report for release
+
+    status_counts holds per-category status tallies already kept by the caller;
+    categories missing from it are tallied here.
+    """
+    # Tally statuses in one pass per category - the breakdown below reuses the counts
+    totals = Counter()
+    category_counts = {}
+    for category, category_results in results.items():
+        counts = (status_counts or {}).get(category)
+        if counts is None:
+            counts = Counter(r.status for r in category_results)
+        category_counts[category] = counts
+        totals.update(counts)
+
+    total_tests = totals.total()
+    passed_tests = totals['PASS']
+    failed_tests = totals['FAIL']
     error_tests = total_tests - passed_tests - failed_tests
 
     print("\n" + "="*80)
@@ -826,9 +1169,10 @@ def generate_release_test_report(results: Dict[str, List[Dict[str, Any]]], total
         if not category_results:
             continue
 
-        category_passed = len([r for r in category_results if r['status'] == 'PASS'])
-        category_failed = len([r for r in category_results if r['status'] == 'FAIL'])
-        category_errors = len([r for r in category_results if r['status'] == 'ERROR'])
+        counts = category_counts[category]
+        category_passed = counts['PASS']
+        category_failed = counts['FAIL']
+        category_errors = counts['ERROR']
         category_total = len(category_results)
         pass_rate = (category_passed / category_total) * 100 if category_total > 0 else 0
 
@@ -836,54 +1180,65 @@ def generate_release_test_report(results: Dict[str, List[Dict[str, Any]]], total
 
     print()
 
-    # Show first few detailed results for debugging
-    if any(results.values()):
+    # Show first few detailed results for debugging - the tallies say whether there are any
+    if total_tests:
         print("🔍 SAMPLE TEST RESULTS:")
         for category, category_results in results.items():
             if category_results:
                 sample = category_results[0]
-                print(f"\n📂 {category} - {sample['test_id']}:")
-                print(f"  Status: {sample['status']}")
-                print(f"  Description: {sample.get('description', 'N/A')}")
-                if sample['status'] == 'ERROR':
-                    print(f"  Error: {sample.get('error', 'Unknown error')}")
-                elif sample['status'] == 'FAIL':
-                    failures = sample.get('verification', {}).get('failures', [])
-                    print(f"  Failures: {'; '.join(failures)}")
+                print(f"\n📂 {category} - {sample.test_id}:")
+                print(f"  Status: {sample.status}")
+                print(f"  Description: {sample.description or 'N/A'}")
+                if sample.status == 'ERROR':
+                    print(f"  Error: {sample.error or 'Unknown error'}")
+                elif sample.status == 'FAIL':
+                    print(f"  Failures: {'; '.join(sample.failures)}")
                 break
 
-    # Failure analysis
-    if failed_tests > 0 or error_tests > 0:
+    # Failure analysis - skipped without a scan on green runs
+    if failed_tests or error_tests:
         print("\n❌ FAILED/ERROR TESTS:")
         for category, category_results in results.items():
-            failed_in_category = [r for r in category_results if r['status'] != 'PASS']
-            if failed_in_category:
+            failed_count = len(category_results) - category_counts[category]['PASS']
+            if failed_count:
                 print(f"\n📂 {category}:")
-                for failure in failed_in_category[:3]:  # Show first 3 failures
-                    error_msg = failure.get('error', '')
-                    if failure.get('verification', {}).get('failures'):
-                        error_msg = '; '.join(failure['verification']['failures'])
-                    print(f"  • {failure['test_id']}: {error_msg}")
-                if len(failed_in_category) > 3:
-                    print(f"  ... and {len(failed_in_category) - 3} more")
+                failed_in_category = (r for r in category_results if r.status != 'PASS')
+                for failure in itertools.islice(failed_in_category, 3):  # Show first 3 failures
+                    error_msg = failure.error or ''
+                    if failure.failures:
+                        error_msg = '; '.join(failure.failures)
+                    print(f"  • {failure.test_id}: {error_msg}")
+                if failed_count > 3:
+                    print(f"  ... and {failed_count - 3} more")
 
     print("\n" + "="*80)
 
     # Write detailed report to file
-    report_data = {
-        'summary': {
-            'total_tests': total_tests,
-            'passed_tests': passed_tests,
-            'failed_tests': failed_tests,
-            'error_tests': error_tests,
-            'total_time': total_time,
-            'pass_rate': (passed_tests / total_tests) * 100 if total_tests > 0 else 0
-        },
-        'results': results
+    summary = {
+        'total_tests': total_tests,
+        'passed_tests': passed_tests,
+        'failed_tests': failed_tests,
+        'error_tests': error_tests,
+        'total_time': total_time,
+        'pass_rate': (passed_tests / total_tests) * 100 if total_tests > 0 else 0
     }
 
-    with open('release_config_test_report.json', 'w') as f:
-        json.dump(report_data, f, indent=2)
+    # Stream the report one result at a time instead of building the whole document.
+    # Compact encode() runs the C encoder - json.dump with indent falls back to the
+    # pure-Python encoder and writes the report a fragment at a time
+    encode = json.JSONEncoder(separators=(',', ':')).encode
+    with open('release_config_test_report.json', 'wb', buffering=1 << 16) as f:
+        f.write(b'{"summary":')
+        f.write(encode(summary).encode())
+        f.write(b',"results":{')
+        for i, (category, category_results) in enumerate(results.items()):
+            f.write(b',' if i else b'')
+            f.write(encode(category).encode() + b':[')
+            for j, r in enumerate(category_results):
+                f.write(b',' if j else b'')
+                f.write(encode(asdict(r)).encode())
+            f.write(b']')
+        f.write(b'}}')
 
     print(f"📄 Detailed report written to: release_config_test_report.json")
 
@@ -894,29 +1249,34 @@ def main():
     parser.add_argument('--category', default='all',
                        choices=['all', 'credentials', 'config', 'otel', 'mixed'],
                        help="Test category to run")
-    parser.add_argument('--workers', type=int, help="Number of parallel workers")
+    parser.add_argument('--workers', type=int,
+                       help="Number of parallel workers (default: min(32, CPUs + 4) threads, or one process per CPU)")
+    parser.add_argument('--executor', default='thread', choices=['thread', 'process'],
+                       help="Run tests on worker threads (default - tests wait on obsctl subprocesses) or processes")
     parser.add_argument('--timeout', type=int, default=1800, help="Total timeout in seconds")
 
     args = parser.parse_args()
 
     try:
-        # Check if obsctl binary exists
-        if not os.path.exists('./target/release/obsctl'):
-            print("❌ obsctl binary not found at ./target/release/obsctl")
+        # Check the obsctl binary once - workers take the resolved path from OBSCTL_BIN
+        try:
+            binary_stat = os.stat(OBSCTL_BINARY)
+        except FileNotFoundError:
+            print(f"❌ obsctl binary not found at {OBSCTL_BINARY}")
             print("Please run: cargo build --release")
             return 1
+        if not binary_stat.st_mode & 0o111:
+            print(f"❌ obsctl binary at {OBSCTL_BINARY} is not executable")
+            return 1
+        os.environ["OBSCTL_BIN"] = OBSCTL_BINARY
 
         # Run tests with timeout
-        result = asyncio.wait_for(
-            run_release_config_tests(args.category, args.workers),
-            timeout=args.timeout
-        )
-        asyncio.run(result)
+        run_release_config_tests(args.category, args.workers, timeout=args.timeout, executor=args.executor)
 
         print("🎉 All tests completed successfully!")
         return 0
 
-    except asyncio.TimeoutError:
+    except TimeoutError:
         print(f"\n⏰ Tests timed out after {args.timeout} seconds")
         return 1
     except KeyboardInterrupt: